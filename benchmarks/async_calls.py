@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from mimid import mock, every, verify
+
+
+class Service:
+    async def fetch(self, key: int) -> int:
+        return key
+
+
+TASKS = 50_000
+
+
+async def call(fetch, key: int) -> int:
+    return await fetch(key)
+
+
+async def bench(name: str, fetch) -> None:
+    start = time.perf_counter()
+    await asyncio.gather(*(call(fetch, key) for key in range(TASKS)))
+    seconds = time.perf_counter() - start
+    print(f"{name:<45} {seconds / TASKS * 1e6:8.3f} us/task")
+
+
+async def main() -> None:
+    service_mock = mock(Service)
+    every(service_mock.fetch).returns(1)
+    await bench(f"{TASKS} tasks, returns", service_mock.fetch)
+    verify(service_mock.fetch).called(times=TASKS)
+
+    async def fetch(key: int) -> int:
+        return key
+
+    await bench(f"{TASKS} tasks, plain coroutine function", fetch)
+
+    service_mock = mock(Service)
+    every(service_mock.fetch).returns_many(range(TASKS))
+    await bench(f"{TASKS} tasks, returns_many", service_mock.fetch)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,48 @@
+import timeit
+
+from mimid import mock, every, verify, gt
+
+
+class Service:
+    def fetch(self, key: int, timeout: float = 1.0) -> int:
+        return key
+
+
+def function(a: int, b: int, *, c: int = 0) -> int:
+    return a + b + c
+
+
+def bench(name: str, stmt, number: int = 10_000) -> None:
+    seconds = min(timeit.repeat(stmt, number=number, repeat=3))
+    print(f"{name:<45} {seconds / number * 1e6:8.3f} us/call")
+
+
+def main() -> None:
+    func_mock = mock(function)
+    every(func_mock).returns(1)
+    bench("function, any args", lambda: func_mock(1, 2, c=3))
+
+    method_mock = mock(Service)
+    every(method_mock.fetch).returns(1)
+    fetch = method_mock.fetch
+    bench("method, any args", lambda: fetch(1))
+
+    configured_mock = mock(function)
+    for i in range(10):
+        every(configured_mock).with_args(i, gt(0)).returns(i)
+    bench("function, 10 with_args configurations", lambda: configured_mock(9, 1), number=1_000)
+
+    table_mock = mock(function)
+    for i in range(1000):
+        every(table_mock).with_args(i, i).returns(i)
+    bench("function, 1000 equality configurations", lambda: table_mock(999, 999), number=1_000)
+
+    verified_mock = mock(function)
+    every(verified_mock).returns(1)
+    for i in range(1000):
+        verified_mock(i, i)
+    bench("verify with_args over 1000 calls", lambda: verify(verified_mock).with_args(gt(0), gt(0)).called(), number=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import time
+
+from mimid import mock, every, verify, gt, lt, Recording
+
+
+def function(a: int, b: float) -> int:
+    return a
+
+
+CALLS = 200_000
+
+
+def measure(func_mock) -> float:
+    start = time.perf_counter()
+    verify(func_mock).with_args(gt(0), lt(100)).called(times=199)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for name, recording in [("full", Recording.full()), ("columnar", Recording.columnar())]:
+        func_mock = mock(function, recording=recording)
+        every(func_mock).returns(1)
+        for i in range(CALLS):
+            func_mock(i, i / 2)
+        seconds = min(measure(func_mock) for _ in range(3))
+        print(f"verify with_args over {CALLS} calls, {name:<20} {seconds * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
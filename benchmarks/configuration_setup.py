@@ -0,0 +1,33 @@
+import time
+
+from mimid import mock, every
+
+
+def function(a: int, b: int) -> int:
+    return a + b
+
+
+def bench(name: str, configure, rows: int) -> None:
+    func_mock = mock(function)
+    start = time.perf_counter()
+    configure(func_mock, rows)
+    print(f"{name:<30} {rows:>7} rows {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+
+def with_args(func_mock, rows: int) -> None:
+    for i in range(rows):
+        every(func_mock).with_args(i, i).returns(i)
+
+
+def with_table(func_mock, rows: int) -> None:
+    every(func_mock).with_table({(i, i): i for i in range(rows)})
+
+
+def main() -> None:
+    for rows in (1_000, 10_000, 100_000):
+        bench("every().with_args().returns()", with_args, rows)
+        bench("every().with_table()", with_table, rows)
+
+
+if __name__ == "__main__":
+    main()
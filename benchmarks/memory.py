@@ -0,0 +1,40 @@
+import tracemalloc
+
+from mimid import mock, every, gt
+
+
+def function(a: int, b: int) -> int:
+    return a + b
+
+
+def measure(name: str, action, count: int) -> None:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    action(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{name:<35} {(after - before) / count:8.1f} bytes")
+
+
+def main() -> None:
+    calls_mock = mock(function)
+    every(calls_mock).returns(1)
+    small = 7
+    measure("per recorded call", lambda count: [calls_mock(small, small) for _ in range(count)], 100_000)
+
+    configurations_mock = mock(function)
+    measure(
+        "per equality configuration",
+        lambda count: [every(configurations_mock).with_args(i, i).returns(i) for i in range(count)],
+        10_000,
+    )
+    matchers_mock = mock(function)
+    measure(
+        "per matcher configuration",
+        lambda count: [every(matchers_mock).with_args(gt(i), gt(i)).returns(i) for i in range(count)],
+        10_000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import timeit
+
+from mimid import mock, every, freeze, MockPool
+
+
+class Service:
+    def get(self, key: str) -> int:
+        return 0
+
+    def put(self, key: str, value: int, ttl: int = 0) -> None:
+        pass
+
+    def delete(self, *keys: str, **options: bool) -> None:
+        pass
+
+    @property
+    def name(self) -> str:
+        return ""
+
+
+def create_and_use() -> None:
+    use(mock(Service))
+
+
+def acquire_and_use(pool: MockPool) -> None:
+    service = pool.acquire(Service)
+    use(service)
+    pool.release(service)
+
+
+def use(service: Service) -> None:
+    every(service.get).returns(1)
+    every(service.put).returns(None)
+    every(service.delete).returns(None)
+    service.get("key")
+    service.put("key", 1)
+    service.delete("key")
+
+
+def configure_many() -> Service:
+    service = mock(Service)
+    for key in range(30):
+        every(service.get).with_args(str(key)).returns(key)
+    every(service.put).returns(None)
+    return service
+
+
+def bench(name: str, stmt, number: int = 2_000) -> None:
+    seconds = min(timeit.repeat(stmt, number=number, repeat=3))
+    print(f"{name:<45} {seconds / number * 1e6:8.3f} us/mock")
+
+
+def main() -> None:
+    bench("mock(), configure and call 3 methods", create_and_use)
+    pool = MockPool()
+    bench("pool acquire, configure, call and release", lambda: acquire_and_use(pool))
+    bench("mock()", lambda: mock(Service))
+    bench("pool acquire and release", lambda: pool.release(pool.acquire(Service)))
+    bench("mock() with 31 configurations", configure_many)
+    template = freeze(configure_many())
+    bench("template with 31 configurations create()", template.create)
+
+
+if __name__ == "__main__":
+    main()
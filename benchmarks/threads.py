@@ -0,0 +1,51 @@
+import threading
+import time
+
+from mimid import mock, every, verify, Recording
+
+
+def function(a: int, b: int) -> int:
+    return a + b
+
+
+THREADS = 32
+CALLS = 2_000
+
+
+def bench(name: str, func_mock) -> None:
+    barrier = threading.Barrier(THREADS + 1)
+
+    def call() -> None:
+        barrier.wait()
+        for i in range(CALLS):
+            func_mock(i, i)
+
+    threads = [threading.Thread(target=call) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    verify(func_mock).called(times=THREADS * CALLS)
+    print(f"{name:<50} {THREADS * CALLS / seconds:12,.0f} calls/s")
+
+
+def main() -> None:
+    for name, kwargs in [
+        ("default", {}),
+        ("thread safe", {"thread_safe": True}),
+        ("thread safe, interned", {"thread_safe": True, "recording": Recording.interned()}),
+    ]:
+        func_mock = mock(function, **kwargs)
+        every(func_mock).returns(1)
+        bench(f"{THREADS} threads, returns, {name}", func_mock)
+
+        func_mock = mock(function, **kwargs)
+        every(func_mock).returns_many(iter(range(THREADS * CALLS)))
+        bench(f"{THREADS} threads, returns_many, {name}", func_mock)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
-from mimid.api import mock, every, verify, slot, prop
+from mimid.api import mock, every, verify, slot, prop, freeze, reset, timeline
+from mimid.pool import MockPool
+from mimid import instrumentation
+from mimid.recording import Recording
+from mimid.retention import Retention
 from mimid.matchers.value import *
+from mimid.matchers.array import digest_eq, allclose, array_like
 from mimid.exceptions import *
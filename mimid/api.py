@@ -1,4 +1,4 @@
-from typing import Union, Any, Type, TypeVar, cast
+from typing import Union, Any, Type, TypeVar, Optional, cast
 
 from mimid.configuration import (
     MockCallable,
@@ -9,15 +9,22 @@ from mimid.configuration import (
     MockArgsConfigurator,
     MockPropertyGetter,
     MockProperty,
+    get_mock_class,
 )
+from mimid.exceptions import CallsNotRecordedException
 from mimid.matchers.value import CaptureSlot
+from mimid.recording import Recording
+from mimid.templates import MockTemplate
+from mimid.timeline import Timeline
 from mimid.verification import MockAttributeVerifier
 
 T = TypeVar("T")
 
 
-def mock(target: Type[T]) -> T:
-    return cast(T, Mock(target))
+def mock(target: Type[T], recording: Optional[Recording] = None, thread_safe: bool = False) -> T:
+    if thread_safe:
+        recording = (recording or Recording.full()).thread_safe()
+    return cast(T, get_mock_class(target)(target, recording=recording))
 
 
 def prop(target: T) -> T:
@@ -42,5 +49,28 @@ def verify(target: Union[MockCallable, Mock, Any]) -> MockAttributeVerifier:
     raise TypeError()
 
 
+def reset(target: Union[MockCallable, Mock, Any], configurations: bool = False) -> None:
+    if isinstance(target, (MockCallable, Mock)):
+        target.reset_mock(configurations=configurations)
+        return
+    raise TypeError()
+
+
+def freeze(target: T) -> MockTemplate[T]:
+    if isinstance(target, Mock):
+        return MockTemplate(target)
+    raise TypeError()
+
+
+def timeline(target: Union[MockCallable, Mock, Any]) -> Timeline:
+    if isinstance(target, Mock):
+        target = target.mock_callable
+    if isinstance(target, MockCallable):
+        if target.timeline is None:
+            raise CallsNotRecordedException("calls timeline is disabled")
+        return target.timeline
+    raise TypeError()
+
+
 def slot() -> CaptureSlot:
     return CaptureSlot()
@@ -1,12 +1,131 @@
+import functools
 import inspect
-from typing import Callable, Any, MutableMapping
+import keyword
+import weakref
+from typing import Callable, Any, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+Binder = Callable[..., tuple]
+
+_signatures: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = weakref.WeakKeyDictionary()
+_binders: "weakref.WeakKeyDictionary[Callable, Binder]" = weakref.WeakKeyDictionary()
+_coroutine_functions: "weakref.WeakKeyDictionary[Callable, bool]" = weakref.WeakKeyDictionary()
+
+
+def _get_cached(
+    cache: "weakref.WeakKeyDictionary[Callable, T]", target: Callable, factory: Callable[[Callable], T]
+) -> T:
+    try:
+        return cache[target]
+    except KeyError:
+        value = factory(target)
+        cache[target] = value
+        return value
+    except TypeError:
+        # target is not hashable or can not be weakly referenced
+        return factory(target)
+
+
+def get_signature(target: Callable) -> inspect.Signature:
+    return _get_cached(_signatures, target, inspect.signature)
+
+
+def get_binder(target: Callable) -> Binder:
+    return _get_cached(_binders, target, lambda t: create_binder(get_signature(t), name=getattr(t, "__name__", "")))
+
+
+def is_coroutine_function(target: Callable) -> bool:
+    return _get_cached(_coroutine_functions, target, _is_coroutine_function)
+
+
+def _is_coroutine_function(target: Callable) -> bool:
+    while isinstance(target, functools.partial):
+        target = target.func
+    return inspect.iscoroutinefunction(target)
+
+
+def create_binder(signature: inspect.Signature, name: str = "") -> Binder:
+    if not name.isidentifier() or keyword.iskeyword(name):
+        name = "bind"
+    namespace: Dict[str, Any] = {}
+    params: List[str] = []
+    names: List[str] = []
+    kind = None
+    for index, parameter in enumerate(signature.parameters.values()):
+        if kind == parameter.POSITIONAL_ONLY and parameter.kind != parameter.POSITIONAL_ONLY:
+            params.append("/")
+        if parameter.kind == parameter.KEYWORD_ONLY and kind not in (parameter.KEYWORD_ONLY, parameter.VAR_POSITIONAL):
+            params.append("*")
+        kind = parameter.kind
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            params.append(f"*{parameter.name}")
+        elif parameter.kind == parameter.VAR_KEYWORD:
+            params.append(f"**{parameter.name}")
+        elif parameter.default is not parameter.empty:
+            default = f"__mimid_default_{index}"
+            namespace[default] = parameter.default
+            params.append(f"{parameter.name}={default}")
+        else:
+            params.append(parameter.name)
+        names.append(parameter.name)
+    if kind == inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+    source = f"def {name}({', '.join(params)}):\n    return ({''.join(n + ', ' for n in names)})\n"
+    try:
+        exec(source, namespace)  # pylint: disable=exec-used
+    except SyntaxError:
+        # e.g. positional-only parameters on Python older than 3.8
+        return _create_fallback_binder(signature)
+    return namespace[name]
+
+
+def _create_fallback_binder(signature: inspect.Signature) -> Binder:
+    def bind(*args, **kwargs) -> tuple:
+        bound_arguments = signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        return tuple(bound_arguments.arguments.values())
+
+    return bind
+
+
+LITERAL_TYPES = frozenset({int, float, complex, str, bytes, bool, type(None)})
+
+
+def is_literal(value: Any) -> bool:
+    value_type = type(value)
+    if value_type in LITERAL_TYPES:
+        return value == value  # pylint: disable=comparison-with-itself
+    if value_type is tuple or value_type is frozenset:
+        return all(is_literal(item) for item in value)
+    return False
 
 
 class CallArguments:
+    __slots__ = ("args", "kwargs", "_target", "_values")
+
     def __init__(self, args: tuple, kwargs: dict) -> None:
         self.args = args
         self.kwargs = kwargs
+        self._target: Any = None
+        self._values: tuple = ()
+
+    @classmethod
+    def from_values(
+        cls, target: Callable, values: tuple, args: Optional[tuple] = None, kwargs: Optional[dict] = None
+    ) -> "CallArguments":
+        # arguments with already bound values, e.g. rebuilt from a columnar call log
+        call_arguments = cls(args=values if args is None else args, kwargs={} if kwargs is None else kwargs)
+        call_arguments._target = target
+        call_arguments._values = values
+        return call_arguments
+
+    @property
+    def target(self) -> Any:
+        return self._target
 
-    def bind(self, target: Callable) -> MutableMapping[str, Any]:
-        signature = inspect.signature(target)
-        return signature.bind(*self.args, **self.kwargs).arguments
+    def bind(self, target: Callable) -> tuple:
+        if self._target is not target:
+            self._values = get_binder(target)(*self.args, **self.kwargs)
+            self._target = target
+        return self._values
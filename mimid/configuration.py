@@ -1,75 +1,400 @@
 import abc
 import functools
-from typing import Optional, Any, List, Dict, Callable
-
-from mimid.common import CallArguments
+import inspect
+import itertools
+import threading
+import time
+import weakref
+from typing import Optional, Any, List, Dict, Callable, Tuple, Iterable, Iterator, Mapping, Union, Type, Set, cast
+
+from mimid.common import CallArguments, is_literal, is_coroutine_function
+from mimid.effects import (
+    CallEffects,
+    CallEffect,
+    Latency,
+    LatencyEffect,
+    ErrorEffect,
+    RateLimitEffect,
+    ConcurrencyLimitEffect,
+)
 from mimid.exceptions import CallNotConfiguredException
-from mimid.matchers.call import SpecificCallArgumentsMatcher, AnyCallArgumentsMatcher, CallArgumentsMatcher
-
+from mimid.instrumentation import MockCallableStats, instrumentation
+from mimid.matchers.call import (
+    AnyCallArgumentsMatcher,
+    CallArgumentsMatcher,
+    TableCallArgumentsMatcher,
+    SpecificCallArgumentsMatcher,
+)
+from mimid.digest import digest_cache
+from mimid.matchers.value import EMPTY_VALUE
+from mimid.recording import CallLog, FullCallLog, Recording
+from mimid.timeline import Timeline
+
+
+class CallConfiguration:  # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "call_arguments_matcher",
+        "exception",
+        "values",
+        "return_values",
+        "last_return_value",
+        "callable",
+        "lock",
+        "effects",
+    )
 
-class CallConfiguration:
     def __init__(
         self,
         call_arguments_matcher: CallArgumentsMatcher,
-        return_values: Optional[List[Any]] = None,
+        return_values: Optional[Iterable[Any]] = None,
         exception: Optional[Exception] = None,
         callable: Optional[Callable[[], Any]] = None,
+        effects: Optional[CallEffects] = None,
     ) -> None:
         self.call_arguments_matcher = call_arguments_matcher
         self.exception = exception
-        self.return_values = return_values
+        self.values = return_values
+        self.return_values: Optional[Iterator[Any]] = None if return_values is None else iter(return_values)
+        self.last_return_value: Any = EMPTY_VALUE
         self.callable = callable
+        # values cursor is advanced atomically, e.g. generators can not be resumed by many threads at once
+        self.lock = threading.Lock() if self.return_values is not None and not _is_repeat(self.return_values) else None
+        self.effects = effects
 
-    def match(self, call_arguments: CallArguments) -> bool:
-        return self.call_arguments_matcher.match(call_arguments)
+    def match(self, values: tuple) -> bool:
+        return self.call_arguments_matcher.match_values(values)
 
-    def execute(self) -> Any:
+    def execute(self, values: tuple = ()) -> Any:  # pylint: disable=unused-argument
         if self.exception is not None:
             raise self.exception
         if self.return_values is not None:
-            if len(self.return_values) > 1:
-                return self.return_values.pop(0)
-            else:
-                return self.return_values[0]
+            if self.lock is None:
+                return next(self.return_values)
+            with self.lock:
+                return self._next_return_value()
         if self.callable is not None:
             return self.callable()
         raise ValueError("Wrong configuration")
 
+    def _next_return_value(self) -> Any:
+        assert self.return_values is not None
+        value = next(self.return_values, EMPTY_VALUE)
+        if value is EMPTY_VALUE:
+            if self.last_return_value is EMPTY_VALUE:
+                raise ValueError("No values to return")
+            # the last value is repeated once all values were returned
+            self.return_values = itertools.repeat(self.last_return_value)
+            return self.last_return_value
+        self.last_return_value = value
+        return value
+
+    def copy(self) -> "CallConfiguration":
+        values = self.values
+        if self.effects is None and (values is None or _is_repeat(values)):
+            # there is no values cursor nor effects state, so configuration can be shared
+            return self
+        return_values = self.return_values
+        if values is not None and return_values is not None and not _is_repeat(values) and iter(values) is values:
+            # one-shot iterator - copy continues from the current cursor
+            if _is_repeat(return_values):
+                values = itertools.repeat(self.last_return_value)
+            else:
+                # values are buffered until both configurations return them
+                self.return_values, values = itertools.tee(return_values)
+                self.values = self.return_values
+        return CallConfiguration(
+            call_arguments_matcher=self.call_arguments_matcher,
+            return_values=values,
+            exception=self.exception,
+            callable=self.callable,
+            effects=self.effects.copy() if self.effects is not None else None,
+        )
+
 
-class MockCallable:
-    def __init__(self, target) -> None:
+def _is_repeat(values: Iterable[Any]) -> bool:
+    return type(values) is itertools.repeat
+
+
+class TableCallConfiguration(CallConfiguration):
+    __slots__ = ("results",)
+
+    def __init__(
+        self, call_arguments_matcher: TableCallArgumentsMatcher, effects: Optional[CallEffects] = None
+    ) -> None:
+        super().__init__(call_arguments_matcher=call_arguments_matcher, effects=effects)
+        self.results = call_arguments_matcher.results
+
+    def execute(self, values: tuple = ()) -> Any:
+        return self.results[values]
+
+    def copy(self) -> "CallConfiguration":
+        if self.effects is None:
+            return self
+        return TableCallConfiguration(
+            call_arguments_matcher=cast(TableCallArgumentsMatcher, self.call_arguments_matcher),
+            effects=self.effects.copy(),
+        )
+
+
+class MockCallable:  # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "target",
+        "call_configurations",
+        "call_log",
+        "indexed_configurations",
+        "scanned_configurations",
+        "waiters",
+        "timeline",
+        "stats",
+    )
+
+    def __init__(self, target, call_log: Optional[CallLog] = None, timeline: Optional[Timeline] = None) -> None:
         self.target = target
         self.call_configurations: List[CallConfiguration] = []
-        self.calls_arguments: List[CallArguments] = []
+        self.call_log = call_log if call_log is not None else FullCallLog()
+        self.indexed_configurations: Dict[tuple, int] = {}
+        self.scanned_configurations: List[Tuple[int, CallConfiguration]] = []
+        self.waiters: List[Callable[[], None]] = []
+        self.timeline = timeline
+        self.stats: Optional[MockCallableStats] = instrumentation.create_stats(target)
 
     def __call__(self, *args, **kwargs) -> Any:
+        if self.timeline is None:
+            return self.execute_call(args, kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return self.execute_call(args, kwargs)
+        finally:
+            self.timeline.append(start, time.perf_counter_ns() - start)
+
+    def execute_call(self, args: tuple, kwargs: dict) -> Any:
+        call_configuration, values = self.record_call(args, kwargs)
+        if call_configuration.effects is not None:
+            return call_configuration.effects.run(call_configuration, values)
+        return call_configuration.execute(values)
+
+    def record_call(self, args: tuple, kwargs: dict) -> Tuple[CallConfiguration, tuple]:
+        if self.stats is not None:
+            return self.record_instrumented_call(self.stats, args, kwargs)
         call_arguments = CallArguments(args=args, kwargs=kwargs)
-        call_arguments.bind(self.target)
-        self.calls_arguments.append(call_arguments)
-        for call_configuration in self.call_configurations:
-            if call_configuration.match(call_arguments):
-                return call_configuration.execute()
-        raise CallNotConfiguredException()
+        values = call_arguments.bind(self.target)
+        self.call_log.append(call_arguments, values)
+        if self.waiters:
+            for waiter in tuple(self.waiters):
+                waiter()
+        call_configuration = self.find_configuration(values)
+        if call_configuration is None:
+            raise CallNotConfiguredException()
+        return call_configuration, values
+
+    def record_instrumented_call(
+        self, stats: MockCallableStats, args: tuple, kwargs: dict
+    ) -> Tuple[CallConfiguration, tuple]:
+        start = time.perf_counter_ns()
+        call_arguments = CallArguments(args=args, kwargs=kwargs)
+        values = call_arguments.bind(self.target)
+        bound = time.perf_counter_ns()
+        self.call_log.append(call_arguments, values)
+        if self.waiters:
+            for waiter in tuple(self.waiters):
+                waiter()
+        dispatch_start = time.perf_counter_ns()
+        position = self.find_instrumented_position(stats, values)
+        stats.add_call(position, bind_ns=bound - start, dispatch_ns=time.perf_counter_ns() - dispatch_start)
+        if position is None:
+            raise CallNotConfiguredException()
+        return self.call_configurations[position], values
+
+    def clone(self, call_log: Optional[CallLog] = None, timeline: Optional[Timeline] = None) -> "MockCallable":
+        mock_callable = type(self)(self.target, call_log=call_log, timeline=timeline)
+        mock_callable.call_configurations = [
+            call_configuration.copy() for call_configuration in self.call_configurations
+        ]
+        mock_callable.indexed_configurations = self.indexed_configurations.copy()
+        mock_callable.scanned_configurations = [
+            (position, mock_callable.call_configurations[position]) for position, _ in self.scanned_configurations
+        ]
+        if mock_callable.stats is not None:
+            mock_callable.stats.add_configuration(len(mock_callable.call_configurations) - 1)
+        return mock_callable
+
+    def reset_mock(self, configurations: bool = False) -> None:
+        self.call_log.clear()
+        if self.timeline is not None:
+            self.timeline.clear()
+        if configurations:
+            self.call_configurations = []
+            self.indexed_configurations = {}
+            self.scanned_configurations = []
+            if self.stats is not None:
+                self.stats.clear_configurations()
+
+    @property
+    def calls_arguments(self) -> List[CallArguments]:
+        return list(self.call_log)
+
+    def find_configuration(self, values: tuple) -> Optional[CallConfiguration]:
+        try:
+            position = self.indexed_configurations.get(values)
+        except TypeError:
+            position = None
+        if position is None and self.indexed_configurations and not is_literal(values):
+            # values may still be equal to indexed keys without having the same hash
+            try:
+                for call_configuration in self.call_configurations:
+                    if call_configuration.match(values):
+                        return call_configuration
+                return None
+            finally:
+                if digest_cache.entry is not None:
+                    digest_cache.clear()
+        if self.scanned_configurations:
+            try:
+                for scanned_position, call_configuration in self.scanned_configurations:
+                    if position is not None and scanned_position > position:
+                        break
+                    if call_configuration.match(values):
+                        return call_configuration
+            finally:
+                if digest_cache.entry is not None:
+                    digest_cache.clear()
+        return None if position is None else self.call_configurations[position]
+
+    def find_instrumented_position(self, stats: MockCallableStats, values: tuple) -> Optional[int]:
+        # the same as find_configuration, but evaluations of matchers are counted
+        try:
+            position = self.indexed_configurations.get(values)
+        except TypeError:
+            position = None
+        if position is None and self.indexed_configurations and not is_literal(values):
+            # values may still be equal to indexed keys without having the same hash
+            scanned: Iterable[Tuple[int, CallConfiguration]] = enumerate(self.call_configurations)
+        else:
+            scanned = self.scanned_configurations
+        try:
+            for scanned_position, call_configuration in scanned:
+                if position is not None and scanned_position > position:
+                    break
+                stats.add_evaluation(scanned_position)
+                if call_configuration.match(values):
+                    return scanned_position
+        finally:
+            digest_cache.clear()
+        return position
 
     def add_configuration(self, call_configuration: CallConfiguration) -> None:
+        position = len(self.call_configurations)
         self.call_configurations.append(call_configuration)
+        if self.stats is not None:
+            self.stats.add_configuration(position)
+        key = call_configuration.call_arguments_matcher.key
+        if key is not None:
+            self.indexed_configurations.setdefault(key, position)
+        else:
+            self.scanned_configurations.append((position, call_configuration))
+
+
+class AsyncMockCallable(MockCallable):
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if self.timeline is None:
+            return self.execute_call(args, kwargs)
+        start = time.perf_counter_ns()
+        try:
+            awaitable = self.execute_call(args, kwargs)
+        except BaseException:
+            self.timeline.append(start, time.perf_counter_ns() - start)
+            raise
+        return self._await_timed(self.timeline, start, awaitable)
+
+    @staticmethod
+    async def _await_timed(timeline: Timeline, start: int, awaitable: Any) -> Any:
+        try:
+            return await awaitable
+        finally:
+            timeline.append(start, time.perf_counter_ns() - start)
+
+    def execute_call(self, args: tuple, kwargs: dict) -> Any:
+        try:
+            call_configuration, values = self.record_call(args, kwargs)
+        except CallNotConfiguredException as exception:
+            return ReadyAwaitable(exception=exception)
+        if call_configuration.effects is not None:
+            return call_configuration.effects.run_async(call_configuration, values)
+        try:
+            result = call_configuration.execute(values)
+        except BaseException as exception:  # pylint: disable=broad-except
+            # e.g. asyncio.CancelledError is raised when awaited, like any other exception
+            return ReadyAwaitable(exception=exception)
+        if call_configuration.callable is not None and inspect.isawaitable(result):
+            return result
+        return ReadyAwaitable(value=result)
+
+
+class ReadyAwaitable:
+    # coroutine-compatible object with already known result, awaiting it never suspends
+    __slots__ = ("value", "exception")
+
+    def __init__(self, value: Any = None, exception: Optional[BaseException] = None) -> None:
+        self.value = value
+        self.exception = exception
+
+    def __await__(self) -> "ReadyAwaitable":
+        return self
+
+    def __iter__(self) -> "ReadyAwaitable":
+        return self
+
+    def __next__(self) -> Any:
+        if self.exception is not None:
+            raise self.exception
+        raise StopIteration(self.value)
+
+    def send(self, value: Any) -> Any:  # pylint: disable=unused-argument
+        return next(self)
+
+    def throw(self, exception: Any, value: Any = None, traceback: Any = None) -> Any:  # pylint: disable=unused-argument
+        raise exception if value is None else value
+
+    def close(self) -> None:
+        pass
+
+
+def create_mock_callable(
+    target: Any, call_log: Optional[CallLog] = None, timeline: Optional[Timeline] = None
+) -> MockCallable:
+    if is_coroutine_function(target):
+        return AsyncMockCallable(target, call_log=call_log, timeline=timeline)
+    return MockCallable(target, call_log=call_log, timeline=timeline)
 
 
 class Mock:
-    def __init__(self, target: Any) -> None:
+    def __init__(
+        self, target: Any, recording: Optional[Recording] = None, mock_callable: Optional[MockCallable] = None
+    ) -> None:
         self.target = target
+        self.recording = recording if recording is not None else Recording.full()
         self.mock_attr_callable: Dict[str, MockCallable] = {}
-        self.mock_callable = MockCallable(self.target)
+        if mock_callable is None:
+            mock_callable = create_mock_callable(
+                self.target, call_log=self.recording.create_call_log(), timeline=self.recording.create_timeline()
+            )
+        self.mock_callable = mock_callable
         self.property_configurations: Dict[str, CallConfiguration] = {}
 
     def __getattr__(self, attr: str) -> MockCallable:
         if attr in self.property_configurations:
             return self.property_configurations[attr].execute()
+        return self.get_mock_attr_callable(attr)
+
+    def get_mock_attr_callable(self, attr: str) -> MockCallable:
         if attr not in self.mock_attr_callable:
-            unbound_method = getattr(self.target, attr)
-            bound_method = functools.partial(unbound_method, None)
-            bound_method.__name__ = unbound_method.__name__  # type: ignore
-            self.mock_attr_callable[attr] = MockCallable(bound_method)
+            self.mock_attr_callable[attr] = create_mock_callable(
+                get_method(self.target, attr),
+                call_log=self.recording.create_call_log(),
+                timeline=self.recording.create_timeline(),
+            )
         return self.mock_attr_callable[attr]
 
     def __call__(self, *args, **kwargs):
@@ -78,6 +403,96 @@ class Mock:
     def add_property_configuration(self, property_: str, call_configuration: CallConfiguration):
         self.property_configurations[property_] = call_configuration
 
+    def reset_mock(self, configurations: bool = False) -> None:
+        self.mock_callable.reset_mock(configurations=configurations)
+        for mock_callable in self.mock_attr_callable.values():
+            mock_callable.reset_mock(configurations=configurations)
+        if configurations:
+            self.property_configurations = {}
+
+
+class MockMethodDescriptor:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional[Mock], owner: Type[Mock]) -> Any:
+        if instance is None:
+            return self
+        mock_callable = instance.get_mock_attr_callable(self.name)
+        # next lookups will find mock callable directly in the instance dict
+        instance.__dict__[self.name] = mock_callable
+        return mock_callable
+
+
+class MockPropertyDescriptor:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional[Mock], owner: Type[Mock]) -> Any:
+        if instance is None:
+            return self
+        try:
+            call_configuration = instance.property_configurations[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        return call_configuration.execute()
+
+
+class TargetMetadata:
+    __slots__ = ("methods", "properties", "mock_class")
+
+    def __init__(self, target: type) -> None:
+        self.methods: Dict[str, Callable] = {}
+        self.properties: Set[str] = set()
+        namespace: Dict[str, Any] = {"__module__": Mock.__module__}
+        for name in dir(target):
+            if name.startswith("__") or hasattr(Mock, name):
+                continue
+            attr = getattr(target, name, None)
+            if isinstance(attr, property):
+                self.properties.add(name)
+                namespace[name] = MockPropertyDescriptor(name)
+            elif callable(attr):
+                self.methods[name] = _bind_method(attr)
+                namespace[name] = MockMethodDescriptor(name)
+        self.mock_class: Type[Mock] = type(f"Mock[{target.__qualname__}]", (Mock,), namespace)
+
+
+_targets_metadata: "weakref.WeakKeyDictionary[type, TargetMetadata]" = weakref.WeakKeyDictionary()
+
+
+def get_target_metadata(target: type) -> TargetMetadata:
+    try:
+        return _targets_metadata[target]
+    except KeyError:
+        target_metadata = _targets_metadata[target] = TargetMetadata(target)
+        return target_metadata
+
+
+def get_mock_class(target: Any) -> Type[Mock]:
+    if not inspect.isclass(target):
+        return Mock
+    return get_target_metadata(target).mock_class
+
+
+def get_method(target: Any, name: str) -> Callable:
+    if inspect.isclass(target):
+        target_metadata = get_target_metadata(target)
+        if name not in target_metadata.methods:
+            target_metadata.methods[name] = _bind_method(getattr(target, name))
+        return target_metadata.methods[name]
+    return _bind_method(getattr(target, name))
+
+
+def _bind_method(unbound_method: Callable) -> Callable:
+    bound_method = functools.partial(unbound_method, None)
+    bound_method.__name__ = getattr(unbound_method, "__name__", "")  # type: ignore
+    return bound_method
+
 
 class MockProperty:
     def __init__(self, mock: Mock, property_: str) -> None:
@@ -105,7 +520,7 @@ class MockEffectsConfigurator(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def returns_many(self, values: List[Any]) -> None:
+    def returns_many(self, values: Iterable[Any]) -> None:
         pass
 
     @abc.abstractmethod
@@ -118,11 +533,38 @@ class MockArgsConfigurator(abc.ABC):
     def with_args(self, *args, **kwargs) -> MockEffectsConfigurator:
         pass
 
+    @abc.abstractmethod
+    def with_table(self, rows: Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def with_latency(self, latency: Latency) -> "MockArgsConfigurator":
+        pass
+
+    @abc.abstractmethod
+    def with_errors(self, exception: Exception, probability: float) -> "MockArgsConfigurator":
+        pass
+
+    @abc.abstractmethod
+    def with_rate_limit(
+        self, rate: float, exception: Exception, burst: Optional[float] = None
+    ) -> "MockArgsConfigurator":
+        pass
+
+    @abc.abstractmethod
+    def with_concurrency_limit(self, limit: int, exception: Exception) -> "MockArgsConfigurator":
+        pass
+
+    @abc.abstractmethod
+    def with_seed(self, seed: Any) -> "MockArgsConfigurator":
+        pass
+
 
 class MockCallableConfigurator(MockArgsConfigurator, MockEffectsConfigurator):
     def __init__(self, mock_callable: MockCallable) -> None:
         self.mock_callable = mock_callable
         self.call_arguments_matcher: CallArgumentsMatcher = AnyCallArgumentsMatcher()
+        self.call_effects: Optional[CallEffects] = None
 
     def with_args(self, *args, **kwargs) -> "MockCallableConfigurator":
         self.call_arguments_matcher = SpecificCallArgumentsMatcher(
@@ -130,24 +572,70 @@ class MockCallableConfigurator(MockArgsConfigurator, MockEffectsConfigurator):
         )
         return self
 
+    def with_table(self, rows: Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]]) -> None:
+        if not isinstance(self.call_arguments_matcher, AnyCallArgumentsMatcher):
+            raise ValueError("with_table can not be combined with with_args")
+        self.mock_callable.add_configuration(
+            TableCallConfiguration(
+                TableCallArgumentsMatcher(target=self.mock_callable.target, rows=rows), effects=self.call_effects
+            )
+        )
+
+    def with_latency(self, latency: Latency) -> "MockCallableConfigurator":
+        return self._add_effect(LatencyEffect(latency))
+
+    def with_errors(self, exception: Exception, probability: float) -> "MockCallableConfigurator":
+        return self._add_effect(ErrorEffect(exception, probability))
+
+    def with_rate_limit(
+        self, rate: float, exception: Exception, burst: Optional[float] = None
+    ) -> "MockCallableConfigurator":
+        return self._add_effect(RateLimitEffect(rate, exception, burst=burst))
+
+    def with_concurrency_limit(self, limit: int, exception: Exception) -> "MockCallableConfigurator":
+        return self._add_effect(ConcurrencyLimitEffect(limit, exception))
+
+    def with_seed(self, seed: Any) -> "MockCallableConfigurator":
+        if self.call_effects is None:
+            self.call_effects = CallEffects(seed)
+        else:
+            self.call_effects.reseed(seed)
+        return self
+
+    def _add_effect(self, effect: CallEffect) -> "MockCallableConfigurator":
+        if self.call_effects is None:
+            self.call_effects = CallEffects()
+        self.call_effects.add(effect)
+        return self
+
     def returns(self, value: Any) -> None:
         self.mock_callable.add_configuration(
-            CallConfiguration(call_arguments_matcher=self.call_arguments_matcher, return_values=[value])
+            CallConfiguration(
+                call_arguments_matcher=self.call_arguments_matcher,
+                return_values=itertools.repeat(value),
+                effects=self.call_effects,
+            )
         )
 
     def raises(self, exception: Exception) -> None:
         self.mock_callable.add_configuration(
-            CallConfiguration(call_arguments_matcher=self.call_arguments_matcher, exception=exception)
+            CallConfiguration(
+                call_arguments_matcher=self.call_arguments_matcher, exception=exception, effects=self.call_effects
+            )
         )
 
-    def returns_many(self, values: List[Any]) -> None:
+    def returns_many(self, values: Iterable[Any]) -> None:
         self.mock_callable.add_configuration(
-            CallConfiguration(call_arguments_matcher=self.call_arguments_matcher, return_values=values)
+            CallConfiguration(
+                call_arguments_matcher=self.call_arguments_matcher, return_values=values, effects=self.call_effects
+            )
         )
 
     def execute(self, callable: Callable[[], Any]):
         self.mock_callable.add_configuration(
-            CallConfiguration(call_arguments_matcher=self.call_arguments_matcher, callable=callable)
+            CallConfiguration(
+                call_arguments_matcher=self.call_arguments_matcher, callable=callable, effects=self.call_effects
+            )
         )
 
 
@@ -164,10 +652,10 @@ class MockPropertyConfigurator(MockEffectsConfigurator):
     def returns(self, value: Any) -> None:
         self.mock_property.mock.add_property_configuration(
             self.mock_property.property,
-            CallConfiguration(call_arguments_matcher=AnyCallArgumentsMatcher(), return_values=[value]),
+            CallConfiguration(call_arguments_matcher=AnyCallArgumentsMatcher(), return_values=itertools.repeat(value)),
         )
 
-    def returns_many(self, values: List[Any]) -> None:
+    def returns_many(self, values: Iterable[Any]) -> None:
         self.mock_property.mock.add_property_configuration(
             self.mock_property.property,
             CallConfiguration(call_arguments_matcher=AnyCallArgumentsMatcher(), return_values=values),
@@ -0,0 +1,82 @@
+import hashlib
+from typing import Any, Optional, Tuple
+
+DIGEST_SIZE = 32
+
+
+class DigestCache:
+    # digest of the last bytes is reused by matchers during a single dispatch or verification pass
+    # and the cache is cleared after the pass, so it does not keep arguments alive
+    __slots__ = ("entry",)
+
+    def __init__(self) -> None:
+        self.entry: Optional[Tuple[bytes, bytes]] = None
+
+    def clear(self) -> None:
+        self.entry = None
+
+
+digest_cache = DigestCache()
+
+
+def get_digest(value: Any) -> bytes:
+    if type(value) is bytes:
+        # bytes are immutable, so digest of the last one can be reused by next matchers
+        entry = digest_cache.entry
+        if entry is not None and entry[0] is value:
+            return entry[1]
+        digest = compute_digest(value)
+        digest_cache.entry = (value, digest)
+        return digest
+    return compute_digest(value)
+
+
+def compute_digest(value: Any) -> bytes:
+    try:
+        return hashlib.blake2b(value, digest_size=DIGEST_SIZE).digest()
+    except BufferError:
+        # e.g. not contiguous memoryview
+        return hashlib.blake2b(memoryview(value).tobytes(), digest_size=DIGEST_SIZE).digest()
+
+
+def get_size(value: Any) -> Optional[int]:
+    if type(value) is bytes or type(value) is bytearray:
+        return len(value)
+    try:
+        with memoryview(value) as view:
+            return view.nbytes
+    except TypeError:
+        return None
+
+
+class Fingerprint:
+    __slots__ = ("size", "digest")
+
+    def __init__(self, size: int, digest: bytes) -> None:
+        self.size = size
+        self.digest = digest
+
+    @classmethod
+    def create(cls, value: Any) -> "Fingerprint":
+        size = get_size(value)
+        if size is None:
+            raise TypeError(f"'{type(value).__name__}' object does not support the buffer protocol")
+        # digest is not cached, so value is not kept alive
+        return cls(size, compute_digest(value))
+
+    def matches(self, value: Any) -> bool:
+        if isinstance(value, Fingerprint):
+            return self.size == value.size and self.digest == value.digest
+        return get_size(value) == self.size and get_digest(value) == self.digest
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Fingerprint) and get_size(other) is None:
+            return NotImplemented
+        return self.matches(other)
+
+    def __hash__(self) -> int:
+        # equal to hashes of other fingerprints only, so buffers have to be compared with matches
+        return hash((self.size, self.digest))
+
+    def __repr__(self) -> str:
+        return f"Fingerprint(size={self.size}, digest={self.digest.hex()[:16]})"
@@ -0,0 +1,156 @@
+import abc
+import asyncio
+import inspect
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mimid.configuration import CallConfiguration
+
+Latency = Union[float, Callable[[random.Random], float]]
+
+
+class CallEffect(abc.ABC):
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def enter(self, rng: random.Random) -> float:
+        pass
+
+    def exit(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def copy(self) -> "CallEffect":
+        pass
+
+
+class LatencyEffect(CallEffect):
+    __slots__ = ("latency",)
+
+    def __init__(self, latency: Latency) -> None:
+        self.latency = latency
+
+    def enter(self, rng: random.Random) -> float:
+        if callable(self.latency):
+            return max(self.latency(rng), 0.0)
+        return self.latency
+
+    def copy(self) -> "LatencyEffect":
+        return LatencyEffect(self.latency)
+
+
+class ErrorEffect(CallEffect):
+    __slots__ = ("exception", "probability")
+
+    def __init__(self, exception: Exception, probability: float) -> None:
+        self.exception = exception
+        self.probability = probability
+
+    def enter(self, rng: random.Random) -> float:
+        if rng.random() < self.probability:
+            raise self.exception
+        return 0.0
+
+    def copy(self) -> "ErrorEffect":
+        return ErrorEffect(self.exception, self.probability)
+
+
+class RateLimitEffect(CallEffect):
+    __slots__ = ("rate", "burst", "exception", "tokens", "updated_at")
+
+    def __init__(self, rate: float, exception: Exception, burst: Optional[float] = None) -> None:
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.exception = exception
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+
+    def enter(self, rng: random.Random) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            raise self.exception
+        self.tokens -= 1
+        return 0.0
+
+    def copy(self) -> "RateLimitEffect":
+        return RateLimitEffect(self.rate, self.exception, burst=self.burst)
+
+
+class ConcurrencyLimitEffect(CallEffect):
+    __slots__ = ("limit", "exception", "concurrency")
+
+    def __init__(self, limit: int, exception: Exception) -> None:
+        self.limit = limit
+        self.exception = exception
+        self.concurrency = 0
+
+    def enter(self, rng: random.Random) -> float:
+        if self.concurrency >= self.limit:
+            raise self.exception
+        self.concurrency += 1
+        return 0.0
+
+    def exit(self) -> None:
+        self.concurrency -= 1
+
+    def copy(self) -> "ConcurrencyLimitEffect":
+        return ConcurrencyLimitEffect(self.limit, self.exception)
+
+
+class CallEffects:
+    __slots__ = ("seed", "rng", "effects", "lock")
+
+    def __init__(self, seed: Any = 0, effects: Optional[List[CallEffect]] = None) -> None:
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.effects = effects if effects is not None else []
+        self.lock = threading.Lock()
+
+    def add(self, effect: CallEffect) -> None:
+        self.effects.append(effect)
+
+    def reseed(self, seed: Any) -> None:
+        self.seed = seed
+        self.rng.seed(seed)
+
+    def copy(self) -> "CallEffects":
+        return CallEffects(self.seed, [effect.copy() for effect in self.effects])
+
+    def run(self, call_configuration: "CallConfiguration", values: tuple) -> Any:
+        entered = 0
+        try:
+            for effect in self.effects:
+                with self.lock:
+                    delay = effect.enter(self.rng)
+                entered += 1
+                if delay > 0:
+                    time.sleep(delay)
+            return call_configuration.execute(values)
+        finally:
+            self._exit(entered)
+
+    async def run_async(self, call_configuration: "CallConfiguration", values: tuple) -> Any:
+        entered = 0
+        try:
+            for effect in self.effects:
+                with self.lock:
+                    delay = effect.enter(self.rng)
+                entered += 1
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            result = call_configuration.execute(values)
+            if call_configuration.callable is not None and inspect.isawaitable(result):
+                return await result
+            return result
+        finally:
+            self._exit(entered)
+
+    def _exit(self, entered: int) -> None:
+        with self.lock:
+            for effect in self.effects[:entered]:
+                effect.exit()
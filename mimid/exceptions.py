@@ -16,3 +16,7 @@ class ValueNotCapturedException(MimidException):
 
 class NotMatchingSignatureException(MimidException):
     pass
+
+
+class CallsNotRecordedException(MimidException):
+    pass
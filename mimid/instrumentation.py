@@ -0,0 +1,143 @@
+import collections
+import functools
+from typing import Callable, Dict, List, Optional
+
+
+class ConfigurationStats:
+    __slots__ = ("position", "hits", "evaluations")
+
+    def __init__(self, position: int) -> None:
+        self.position = position
+        self.hits = 0
+        self.evaluations = 0
+
+
+class MockCallableStats:  # pylint: disable=too-many-instance-attributes
+    __slots__ = ("name", "calls", "misses", "bind_ns", "dispatch_ns", "verifications", "verify_ns", "configurations")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.misses = 0
+        self.bind_ns = 0
+        self.dispatch_ns = 0
+        self.verifications = 0
+        self.verify_ns = 0
+        # counters only, by configuration position - configurations and their values are not kept alive
+        self.configurations: List[ConfigurationStats] = []
+
+    def add_configuration(self, position: int) -> None:
+        while len(self.configurations) <= position:
+            self.configurations.append(ConfigurationStats(len(self.configurations)))
+
+    def clear_configurations(self) -> None:
+        self.configurations = []
+
+    def add_evaluation(self, position: int) -> None:
+        self.configurations[position].evaluations += 1
+
+    def add_call(self, position: Optional[int], bind_ns: int, dispatch_ns: int) -> None:
+        self.calls += 1
+        self.bind_ns += bind_ns
+        self.dispatch_ns += dispatch_ns
+        if position is None:
+            self.misses += 1
+        else:
+            self.configurations[position].hits += 1
+
+    def add_verification(self, verify_ns: int) -> None:
+        self.verifications += 1
+        self.verify_ns += verify_ns
+
+    @property
+    def hits(self) -> int:
+        return self.calls - self.misses
+
+    @property
+    def evaluations(self) -> int:
+        return sum(configuration_stats.evaluations for configuration_stats in self.configurations)
+
+    @property
+    def cost_ns(self) -> int:
+        return self.bind_ns + self.dispatch_ns + self.verify_ns
+
+
+class Instrumentation:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stats: List[MockCallableStats] = []
+
+    def create_stats(self, target: Callable) -> Optional[MockCallableStats]:
+        if not self.enabled:
+            return None
+        stats = MockCallableStats(_get_name(target))
+        self.stats.append(stats)
+        return stats
+
+
+instrumentation = Instrumentation()
+
+
+def enable() -> None:
+    instrumentation.enabled = True
+
+
+def disable() -> None:
+    instrumentation.enabled = False
+
+
+def is_enabled() -> bool:
+    return instrumentation.enabled
+
+
+def clear() -> None:
+    instrumentation.stats.clear()
+
+
+def collect() -> List[MockCallableStats]:
+    # stats of mocks of the same target are summed
+    collected: Dict[str, MockCallableStats] = collections.OrderedDict()
+    for stats in instrumentation.stats:
+        total = collected.setdefault(stats.name, MockCallableStats(stats.name))
+        total.calls += stats.calls
+        total.misses += stats.misses
+        total.bind_ns += stats.bind_ns
+        total.dispatch_ns += stats.dispatch_ns
+        total.verifications += stats.verifications
+        total.verify_ns += stats.verify_ns
+        total.add_configuration(len(stats.configurations) - 1)
+        for configuration_stats in stats.configurations:
+            # e.g. mocks created from the same template have the same configurations at the same positions
+            total_configuration_stats = total.configurations[configuration_stats.position]
+            total_configuration_stats.hits += configuration_stats.hits
+            total_configuration_stats.evaluations += configuration_stats.evaluations
+    used = [stats for stats in collected.values() if stats.calls or stats.verifications or stats.configurations]
+    return sorted(used, key=lambda stats: stats.cost_ns, reverse=True)
+
+
+def report(limit: Optional[int] = None) -> str:
+    collected = collect()[:limit]
+    lines = [
+        f"{'mock':<40} {'calls':>8} {'misses':>8} {'matchers':>8} {'bind ms':>9} {'dispatch ms':>12} {'verify ms':>10}"
+    ]
+    for stats in collected:
+        lines.append(
+            f"{stats.name:<40} {stats.calls:>8} {stats.misses:>8} {stats.evaluations:>8} "
+            f"{stats.bind_ns / 1e6:>9.3f} {stats.dispatch_ns / 1e6:>12.3f} {stats.verify_ns / 1e6:>10.3f}"
+        )
+    never_hit = dict.fromkeys(
+        f"{stats.name}: configuration #{configuration_stats.position}"
+        for stats in collected
+        for configuration_stats in stats.configurations
+        if configuration_stats.hits == 0
+    )
+    if never_hit:
+        lines.append("never hit configurations:")
+        lines.extend(f"  {line}" for line in never_hit)
+    return "\n".join(lines) + "\n"
+
+
+def _get_name(target: Callable) -> str:
+    while isinstance(target, functools.partial):
+        target = target.func
+    return getattr(target, "__qualname__", repr(target))
@@ -0,0 +1,65 @@
+from typing import Any, Optional, Tuple
+
+from mimid.digest import Fingerprint, compute_digest, get_digest, get_size
+from mimid.matchers.value import ValueMatcher
+
+
+class DigestEqualValueMatcher(ValueMatcher):
+    __slots__ = ("size", "digest")
+
+    def __init__(self, value: Any) -> None:
+        size = get_size(value)
+        if size is None:
+            raise TypeError(f"'{type(value).__name__}' object does not support the buffer protocol")
+        self.size = size
+        self.digest = compute_digest(value)
+
+    def __call__(self, value: Any) -> bool:
+        if isinstance(value, Fingerprint):
+            return value.size == self.size and value.digest == self.digest
+        if get_size(value) != self.size:
+            return False
+        return get_digest(value) == self.digest
+
+
+class AllCloseValueMatcher(ValueMatcher):
+    __slots__ = ("value", "rtol", "atol", "equal_nan")
+
+    def __init__(self, value: Any, rtol: float = 1e-05, atol: float = 1e-08, equal_nan: bool = False) -> None:
+        self.value = value
+        self.rtol = rtol
+        self.atol = atol
+        self.equal_nan = equal_nan
+
+    def __call__(self, value: Any) -> bool:
+        import numpy  # type: ignore # pylint: disable=import-outside-toplevel
+
+        if numpy.shape(value) != numpy.shape(self.value):
+            return False
+        return bool(numpy.allclose(value, self.value, rtol=self.rtol, atol=self.atol, equal_nan=self.equal_nan))
+
+
+class ArrayLikeValueMatcher(ValueMatcher):
+    __slots__ = ("shape", "dtype")
+
+    def __init__(self, shape: Optional[Tuple[Optional[int], ...]] = None, dtype: Any = None) -> None:
+        self.shape = shape
+        self.dtype = dtype
+
+    def __call__(self, value: Any) -> bool:
+        shape = getattr(value, "shape", None)
+        dtype = getattr(value, "dtype", None)
+        if shape is None or dtype is None:
+            return False
+        if self.shape is not None:
+            if len(shape) != len(self.shape):
+                return False
+            for size, expected_size in zip(shape, self.shape):
+                if expected_size is not None and size != expected_size:
+                    return False
+        return self.dtype is None or dtype == self.dtype
+
+
+digest_eq = DigestEqualValueMatcher
+allclose = AllCloseValueMatcher
+array_like = ArrayLikeValueMatcher
@@ -1,34 +1,50 @@
 import abc
-from typing import Callable
+import inspect
+from typing import Callable, Optional, Tuple, Iterable, Any, Dict, Mapping, Union
 
-from mimid.common import CallArguments
+from mimid.common import CallArguments, is_literal, get_binder, get_signature
 from mimid.exceptions import NotMatchingSignatureException
-from mimid.matchers.value import ValueMatcher
+from mimid.matchers.value import ValueMatcher, EqualValueMatcher
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
 
 
 class CallArgumentsMatcher(abc.ABC):
+    __slots__ = ()
+
+    key: Optional[tuple] = None
+
     @abc.abstractmethod
     def match(self, arguments: CallArguments) -> bool:
         pass
 
+    @abc.abstractmethod
+    def match_values(self, values: tuple) -> bool:
+        pass
+
 
 class SpecificCallArgumentsMatcher(CallArgumentsMatcher):
+    __slots__ = ("target", "matchers", "key")
+
     def __init__(self, target: Callable, arguments: CallArguments) -> None:
         self.target = target
-        self.arguments = arguments
         try:
-            self.arguments.bind(self.target)
+            values = arguments.bind(self.target)
         except TypeError:
             raise NotMatchingSignatureException()
+        self.matchers = tuple(ValueMatcher.from_maybe_value(value) for value in values)
+        self.key = _get_key(self.matchers)
 
     def match(self, arguments: CallArguments) -> bool:
         try:
-            call_args_binding = arguments.bind(self.target)
-            matchers_args_binding = self.arguments.bind(self.target)
-            for arg in call_args_binding:
-                value = call_args_binding[arg]
-                matcher = matchers_args_binding[arg]
-                matcher = ValueMatcher.from_maybe_value(matcher)
+            values = arguments.bind(self.target)
+        except TypeError:
+            return False
+        return self.match_values(values)
+
+    def match_values(self, values: tuple) -> bool:
+        try:
+            for matcher, value in zip(self.matchers, values):
                 if not matcher(value):
                     return False
             return True
@@ -36,6 +52,61 @@ class SpecificCallArgumentsMatcher(CallArgumentsMatcher):
             return False
 
 
+def _get_key(matchers: Tuple[ValueMatcher, ...]) -> Optional[tuple]:
+    key = []
+    for matcher in matchers:
+        if not isinstance(matcher, EqualValueMatcher) or not is_literal(matcher.value):
+            return None
+        key.append(matcher.value)
+    return tuple(key)
+
+
 class AnyCallArgumentsMatcher(CallArgumentsMatcher):
+    __slots__ = ()
+
     def match(self, arguments: CallArguments) -> bool:
         return True
+
+    def match_values(self, values: tuple) -> bool:
+        return True
+
+
+class TableCallArgumentsMatcher(CallArgumentsMatcher):
+    __slots__ = ("target", "results")
+
+    def __init__(self, target: Callable, rows: Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]]) -> None:
+        self.target = target
+        self.results = _normalize_table(target, dict(rows))
+
+    def match(self, arguments: CallArguments) -> bool:
+        try:
+            values = arguments.bind(self.target)
+        except TypeError:
+            return False
+        return self.match_values(values)
+
+    def match_values(self, values: tuple) -> bool:
+        try:
+            return values in self.results
+        except TypeError:
+            return False
+
+
+def _normalize_table(target: Callable, table: Dict[Any, Any]) -> Dict[tuple, Any]:
+    parameters = get_signature(target).parameters.values()
+    if all(p.kind in _POSITIONAL_KINDS and p.default is p.empty for p in parameters):
+        # fast path - rows are already normalized or need only to be wrapped into tuples
+        keys_types = set(map(type, table))
+        if keys_types == {tuple} and set(map(len, table)) == {len(parameters)}:
+            return table
+        if len(parameters) == 1 and tuple not in keys_types:
+            return dict(zip(zip(table), table.values()))
+    binder = get_binder(target)
+    results = {}
+    for args, result in table.items():
+        try:
+            values = binder(*args) if type(args) is tuple else binder(args)
+        except TypeError:
+            raise NotMatchingSignatureException()
+        results[values] = result
+    return results
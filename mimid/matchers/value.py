@@ -1,105 +1,445 @@
 import abc
-from typing import Any
+import bisect
+import itertools
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Tuple
 
+from mimid.common import is_literal
+from mimid.digest import Fingerprint
 from mimid.exceptions import ValueNotCapturedException
 
 
 class ValueMatcher(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(self, other: Any) -> bool:
         pass
 
+    def to_mask(self, values: Any) -> Any:  # pylint: disable=unused-argument
+        # returns boolean mask of matching NumPy array values or None if matcher can not be vectorized
+        return None
+
     @staticmethod
     def from_maybe_value(value) -> "ValueMatcher":
-        if not isinstance(value, ValueMatcher):
-            value = EqualValueMatcher(value)
-        return value
+        if isinstance(value, ValueMatcher):
+            return value
+        if is_array(value):
+            # == of arrays returns an array, which can not be used as a match result
+            return ArrayEqualValueMatcher(value)
+        return EqualValueMatcher(value)
 
     def __or__(self, other: "ValueMatcher") -> "ValueMatcher":
-        return OrValueMatcher(self, other)
+        return create_or_matcher(self, other)
 
     def __and__(self, other: "ValueMatcher") -> "ValueMatcher":
-        return AndValueMatcher(self, other)
+        return create_and_matcher(self, other)
 
     def __invert__(self) -> "ValueMatcher":
         return NotValueMatcher(self)
 
 
 class OrValueMatcher(ValueMatcher):
-    def __init__(self, first: ValueMatcher, second: ValueMatcher) -> None:
-        self.first = first
-        self.second = second
+    __slots__ = ("matchers",)
+
+    def __init__(self, *matchers: ValueMatcher) -> None:
+        self.matchers = _flatten(OrValueMatcher, matchers)
 
     def __call__(self, value: Any) -> bool:
-        return self.first(value) or self.second(value)
+        for matcher in self.matchers:
+            if matcher(value):
+                return True
+        return False
+
+    def to_mask(self, values: Any) -> Any:
+        mask = None
+        for matcher in self.matchers:
+            matcher_mask = matcher.to_mask(values)
+            if matcher_mask is None:
+                return None
+            mask = matcher_mask if mask is None else mask | matcher_mask
+        return mask
 
 
 class AndValueMatcher(ValueMatcher):
-    def __init__(self, first: ValueMatcher, second: ValueMatcher) -> None:
-        self.first = first
-        self.second = second
+    __slots__ = ("matchers",)
+
+    def __init__(self, *matchers: ValueMatcher) -> None:
+        self.matchers = _flatten(AndValueMatcher, matchers)
 
     def __call__(self, value: Any) -> bool:
-        return self.first(value) and self.second(value)
+        for matcher in self.matchers:
+            if not matcher(value):
+                return False
+        return True
+
+    def to_mask(self, values: Any) -> Any:
+        mask = None
+        for matcher in self.matchers:
+            matcher_mask = matcher.to_mask(values)
+            if matcher_mask is None:
+                return None
+            mask = matcher_mask if mask is None else mask & matcher_mask
+        return mask
+
+
+def _flatten(combinator: type, matchers: Tuple[ValueMatcher, ...]) -> Tuple[ValueMatcher, ...]:
+    if combinator not in map(type, matchers):
+        return matchers
+    flattened: List[ValueMatcher] = []
+    for matcher in matchers:
+        if type(matcher) is combinator:
+            flattened.extend(matcher.matchers)  # type: ignore
+        else:
+            flattened.append(matcher)
+    return tuple(flattened)
 
 
 class NotValueMatcher(ValueMatcher):
+    __slots__ = ("matcher",)
+
     def __init__(self, matcher: ValueMatcher) -> None:
         self.matcher = matcher
 
     def __call__(self, value: Any) -> bool:
         return not self.matcher(value)
 
+    def __invert__(self) -> ValueMatcher:
+        return self.matcher
+
+    def to_mask(self, values: Any) -> Any:
+        mask = self.matcher.to_mask(values)
+        if mask is None:
+            return None
+        return ~mask
+
 
 class AnyValueMatcher(ValueMatcher):
+    __slots__ = ()
+
     def __call__(self, _: Any) -> bool:
         return True
 
 
 class EqualValueMatcher(ValueMatcher):
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         self.value = value
 
     def __call__(self, value: Any) -> bool:
-        return value == self.value
+        return equals(value, self.value)
+
+    def to_mask(self, values: Any) -> Any:
+        if not is_vectorizable(self.value):
+            return None
+        return values == self.value
+
+
+class ArrayEqualValueMatcher(ValueMatcher):
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self, value: Any) -> bool:
+        return array_equal(value, self.value)
+
+
+def equals(first: Any, second: Any) -> bool:
+    try:
+        result = first == second
+    except ValueError:
+        # e.g. arrays with shapes which can not be broadcast together
+        if not is_array(first) and not is_array(second):
+            raise
+        return array_equal(first, second)
+    if type(result) is bool:
+        return result
+    if is_array(first) or is_array(second):
+        # == of arrays returns an array, which can not be used as a match result
+        return array_equal(first, second)
+    return bool(result)
+
+
+def array_equal(first: Any, second: Any) -> bool:
+    if type(second) is Fingerprint:
+        first, second = second, first
+    if type(first) is Fingerprint:
+        # e.g. array retained as fingerprint
+        return first.matches(second)
+    import numpy  # type: ignore # pylint: disable=import-outside-toplevel
+
+    return bool(numpy.array_equal(first, second))
 
 
 class GreaterValueMatcher(ValueMatcher):
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         self.value = value
 
     def __call__(self, value: Any) -> bool:
         return value > self.value
 
+    def to_mask(self, values: Any) -> Any:
+        if not is_vectorizable(self.value):
+            return None
+        return values > self.value
+
 
 class GreaterThanValueMatcher(ValueMatcher):
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         self.value = value
 
     def __call__(self, value: Any) -> bool:
         return value >= self.value
 
+    def to_mask(self, values: Any) -> Any:
+        if not is_vectorizable(self.value):
+            return None
+        return values >= self.value
+
 
 class LowerValueMatcher(ValueMatcher):
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         self.value = value
 
     def __call__(self, value: Any) -> bool:
         return value < self.value
 
+    def to_mask(self, values: Any) -> Any:
+        if not is_vectorizable(self.value):
+            return None
+        return values < self.value
+
 
 class LowerThanValueMatcher(ValueMatcher):
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         self.value = value
 
     def __call__(self, value: Any) -> bool:
         return value <= self.value
 
+    def to_mask(self, values: Any) -> Any:
+        if not is_vectorizable(self.value):
+            return None
+        return values <= self.value
+
+
+class OneOfValueMatcher(ValueMatcher):
+    __slots__ = ("values", "others")
+
+    def __init__(self, values: FrozenSet[Any], others: Tuple[Any, ...] = ()) -> None:
+        self.values = values
+        # values which can not be hashed
+        self.others = others
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "OneOfValueMatcher":
+        hashable: List[Any] = []
+        others: List[Any] = []
+        for value in values:
+            try:
+                hash(value)
+            except TypeError:
+                others.append(value)
+            else:
+                hashable.append(value)
+        return cls(values=frozenset(hashable), others=tuple(others))
+
+    def __call__(self, value: Any) -> bool:
+        if type(value) is Fingerprint:
+            # fingerprint does not have the same hash as buffer it was created from
+            for expected_value in itertools.chain(self.values, self.others):
+                if value.matches(expected_value):
+                    return True
+            return False
+        try:
+            # equal hashable values have equal hashes, e.g. IntEnum members or NumPy scalars and numbers
+            if value in self.values:
+                return True
+        except TypeError:
+            # value can not be hashed, but it still may be equal to some values
+            for expected_value in self.values:
+                if equals(value, expected_value):
+                    return True
+        for expected_value in self.others:
+            if equals(value, expected_value):
+                return True
+        return False
+
+    def to_mask(self, values: Any) -> Any:
+        if self.others or not all(is_vectorizable(value) for value in self.values):
+            return None
+        import numpy  # type: ignore # pylint: disable=import-outside-toplevel
+
+        return numpy.isin(values, list(self.values))
+
+
+class InRangesValueMatcher(ValueMatcher):
+    __slots__ = ("lows", "highs")
+
+    def __init__(self, *ranges: Tuple[Any, Any]) -> None:
+        lows: List[Any] = []
+        highs: List[Any] = []
+        for low, high in sorted(ranges):
+            if not low <= high:
+                raise ValueError(f"invalid range: ({low!r}, {high!r})")
+            if highs and low <= highs[-1]:
+                # overlapping ranges are merged, so ranges are disjoint and sorted by both bounds
+                highs[-1] = max(highs[-1], high)
+            else:
+                lows.append(low)
+                highs.append(high)
+        self.lows = lows
+        self.highs = highs
+
+    def __call__(self, value: Any) -> bool:
+        index = bisect.bisect_right(self.lows, value)
+        return index > 0 and value <= self.highs[index - 1]
+
+    def to_mask(self, values: Any) -> Any:
+        if not self.lows or not all(is_vectorizable(bound) for bound in self.lows + self.highs):
+            return None
+        import numpy  # type: ignore # pylint: disable=import-outside-toplevel
+
+        indexes = numpy.searchsorted(self.lows, values, side="right")
+        return (indexes > 0) & (values <= numpy.array(self.highs)[indexes - 1])
+
+
+Bound = Optional[Tuple[Any, bool]]
+
+
+class IntervalValueMatcher(ValueMatcher):
+    __slots__ = ("lower", "upper")
+
+    def __init__(self, lower: Bound = None, upper: Bound = None) -> None:
+        self.lower = lower
+        self.upper = upper
+
+    def __call__(self, value: Any) -> bool:
+        if self.lower is not None:
+            lower, inclusive = self.lower
+            if not (value >= lower if inclusive else value > lower):
+                return False
+        if self.upper is not None:
+            upper, inclusive = self.upper
+            if not (value <= upper if inclusive else value < upper):
+                return False
+        return True
+
+    def to_mask(self, values: Any) -> Any:
+        mask: Any = True
+        if self.lower is not None:
+            lower, inclusive = self.lower
+            if not is_vectorizable(lower):
+                return None
+            mask = mask & (values >= lower if inclusive else values > lower)
+        if self.upper is not None:
+            upper, inclusive = self.upper
+            if not is_vectorizable(upper):
+                return None
+            mask = mask & (values <= upper if inclusive else values < upper)
+        return None if mask is True else mask
+
+
+def create_or_matcher(*matchers: ValueMatcher) -> ValueMatcher:
+    merged: List[ValueMatcher] = []
+    for matcher in matchers:
+        parts = matcher.matchers if type(matcher) is OrValueMatcher else (matcher,)  # type: ignore
+        values = _get_equal_values(parts[0])
+        previous_values = _get_equal_values(merged[-1]) if merged and values is not None else None
+        if values is not None and previous_values is not None:
+            # only adjacent matchers are merged, so evaluation order of other matchers does not change
+            merged[-1] = OneOfValueMatcher(previous_values | values)
+        else:
+            merged.append(parts[0])
+        # parts of existing matcher are already merged
+        merged.extend(parts[1:])
+    return merged[0] if len(merged) == 1 else OrValueMatcher(*merged)
+
+
+def create_and_matcher(*matchers: ValueMatcher) -> ValueMatcher:
+    merged: List[ValueMatcher] = []
+    for matcher in matchers:
+        parts = matcher.matchers if type(matcher) is AndValueMatcher else (matcher,)  # type: ignore
+        bounds = _get_bounds(parts[0])
+        previous_bounds = _get_bounds(merged[-1]) if merged and bounds is not None else None
+        if bounds is not None and previous_bounds is not None:
+            merged[-1] = IntervalValueMatcher(
+                lower=_merge_bounds(previous_bounds[0], bounds[0], max),
+                upper=_merge_bounds(previous_bounds[1], bounds[1], min),
+            )
+        else:
+            merged.append(parts[0])
+        merged.extend(parts[1:])
+    return merged[0] if len(merged) == 1 else AndValueMatcher(*merged)
+
+
+def _get_equal_values(matcher: ValueMatcher) -> Optional[FrozenSet[Any]]:
+    if type(matcher) is EqualValueMatcher and is_literal(matcher.value):
+        return frozenset((matcher.value,))
+    if type(matcher) is OneOfValueMatcher and not matcher.others:
+        return matcher.values
+    return None
+
+
+def _get_bounds(matcher: ValueMatcher) -> Optional[Tuple[Bound, Bound]]:
+    matcher_type = type(matcher)
+    if matcher_type is IntervalValueMatcher:
+        return matcher.lower, matcher.upper  # type: ignore
+    if matcher_type not in _BOUNDS or not _is_number(matcher.value):  # type: ignore
+        return None
+    is_lower, inclusive = _BOUNDS[matcher_type]
+    bound = (matcher.value, inclusive)  # type: ignore
+    return (bound, None) if is_lower else (None, bound)
+
+
+def _merge_bounds(first: Bound, second: Bound, stricter: Callable[[Any, Any], Any]) -> Bound:
+    if first is None or second is None:
+        return first if second is None else second
+    if first[0] == second[0]:
+        # exclusive bound is stricter than inclusive one
+        return first[0], first[1] and second[1]
+    return first if stricter(first[0], second[0]) == first[0] else second
+
+
+def _is_number(value: Any) -> bool:
+    value_type = type(value)
+    return (value_type is int or value_type is float) and value == value  # pylint: disable=comparison-with-itself
+
+
+def is_array(value: Any) -> bool:
+    value_type = type(value)
+    return hasattr(value_type, "__array__") and hasattr(value_type, "shape")
+
+
+def is_vectorizable(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is int or value_type is bool:
+        return -(2**63) <= value < 2**63
+    return value_type is float
+
+
+_BOUNDS = {
+    GreaterValueMatcher: (True, False),
+    GreaterThanValueMatcher: (True, True),
+    LowerValueMatcher: (False, False),
+    LowerThanValueMatcher: (False, True),
+}
 
 EMPTY_VALUE = object()
 
 
 class CaptureSlot:
+    __slots__ = ("_value",)
+
     def __init__(self):
         self._value = EMPTY_VALUE
 
@@ -115,6 +455,8 @@ class CaptureSlot:
 
 
 class CaptureValueMatcher(ValueMatcher):
+    __slots__ = ("slot",)
+
     def __init__(self, slot: CaptureSlot) -> None:
         self.slot = slot
 
@@ -125,8 +467,11 @@ class CaptureValueMatcher(ValueMatcher):
 
 any = AnyValueMatcher
 eq = EqualValueMatcher
+array_eq = ArrayEqualValueMatcher
 lt = LowerValueMatcher
 lte = LowerThanValueMatcher
 gt = GreaterValueMatcher
 gte = GreaterThanValueMatcher
 capture = CaptureValueMatcher
+one_of = OneOfValueMatcher.from_values
+in_ranges = InRangesValueMatcher
@@ -0,0 +1,25 @@
+import collections
+from typing import Any, Dict, List, Optional, Type, TypeVar, cast
+
+from mimid.configuration import Mock, get_mock_class
+from mimid.recording import Recording
+
+T = TypeVar("T")
+
+
+class MockPool:
+    def __init__(self, recording: Optional[Recording] = None) -> None:
+        self.recording = recording
+        self.mocks: Dict[Any, List[Mock]] = collections.defaultdict(list)
+
+    def acquire(self, target: Type[T]) -> T:
+        mocks = self.mocks.get(target)
+        if mocks:
+            return cast(T, mocks.pop())
+        return cast(T, get_mock_class(target)(target, recording=self.recording))
+
+    def release(self, mock: Any) -> None:
+        if not isinstance(mock, Mock):
+            raise TypeError()
+        mock.reset_mock(configurations=True)
+        self.mocks[mock.target].append(mock)
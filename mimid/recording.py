@@ -0,0 +1,506 @@
+import abc
+import array
+import collections
+import functools
+import io
+import mmap
+import pickle
+import struct
+import tempfile
+import threading
+import weakref
+from typing import Any, Callable, Iterator, List, Deque, Dict, Optional, IO, Tuple
+
+from mimid.common import CallArguments, LITERAL_TYPES
+from mimid.exceptions import CallsNotRecordedException
+from mimid.matchers.call import CallArgumentsMatcher, SpecificCallArgumentsMatcher
+from mimid.matchers.value import AnyValueMatcher
+from mimid.retention import Retention
+from mimid.timeline import Timeline
+
+
+class CallLog(abc.ABC):
+    # False if call log does not keep calls arguments, e.g. it only counts calls
+    stores_arguments = True
+
+    @abc.abstractmethod
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        pass
+
+    @abc.abstractmethod
+    def count(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[CallArguments]:
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def count_matching(self, call_arguments_matcher: CallArgumentsMatcher) -> int:
+        matches = 0
+        for call_arguments in self:
+            if call_arguments_matcher.match(call_arguments):
+                matches += 1
+        return matches
+
+
+class FullCallLog(CallLog):
+    def __init__(self) -> None:
+        self.calls_arguments: List[CallArguments] = []
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        self.calls_arguments.append(call_arguments)
+
+    def count(self) -> int:
+        return len(self.calls_arguments)
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        return iter(self.calls_arguments)
+
+    def clear(self) -> None:
+        self.calls_arguments.clear()
+
+
+class BoundedCallLog(CallLog):
+    def __init__(self, max_calls: int) -> None:
+        self.calls_arguments: Deque[CallArguments] = collections.deque(maxlen=max_calls)
+        self.calls_count = 0
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        self.calls_arguments.append(call_arguments)
+        self.calls_count += 1
+
+    def count(self) -> int:
+        return self.calls_count
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        if self.calls_count > len(self.calls_arguments):
+            raise CallsNotRecordedException(
+                f"only the last {len(self.calls_arguments)} of {self.calls_count} calls were recorded"
+            )
+        return iter(self.calls_arguments)
+
+    def clear(self) -> None:
+        self.calls_arguments.clear()
+        self.calls_count = 0
+
+
+class CountingCallLog(CallLog):
+    stores_arguments = False
+
+    def __init__(self) -> None:
+        self.calls_count = 0
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        self.calls_count += 1
+
+    def count(self) -> int:
+        return self.calls_count
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        raise CallsNotRecordedException("only the number of calls was recorded")
+
+    def clear(self) -> None:
+        self.calls_count = 0
+
+
+class DisabledCallLog(CallLog):
+    stores_arguments = False
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        pass
+
+    def count(self) -> int:
+        raise CallsNotRecordedException("calls recording is disabled")
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        raise CallsNotRecordedException("calls recording is disabled")
+
+    def clear(self) -> None:
+        pass
+
+
+class InternedCallLog(CallLog):
+    def __init__(self) -> None:
+        self.calls_arguments: List[CallArguments] = []
+        self.calls_counts: List[int] = []
+        self.indexes: Dict[Tuple[tuple, tuple], int] = {}
+        self.calls = array.array("I")
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        # equal values of different types (e.g. 1, 1.0 and True) are not interned together
+        key = (values, tuple(map(type, values)))
+        try:
+            index: Optional[int] = self.indexes.get(key)
+            hashable = True
+        except TypeError:
+            index = None
+            hashable = False
+        if index is None:
+            index = len(self.calls_arguments)
+            self.calls_arguments.append(call_arguments)
+            self.calls_counts.append(0)
+            if hashable:
+                self.indexes[key] = index
+        self.calls_counts[index] += 1
+        self.calls.append(index)
+
+    def count(self) -> int:
+        return len(self.calls)
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        calls_arguments = self.calls_arguments
+        return (calls_arguments[index] for index in self.calls)
+
+    def clear(self) -> None:
+        self.calls_arguments.clear()
+        self.calls_counts.clear()
+        self.indexes.clear()
+        del self.calls[:]
+
+    def count_matching(self, call_arguments_matcher: CallArgumentsMatcher) -> int:
+        matches = 0
+        for call_arguments, calls_count in zip(self.calls_arguments, self.calls_counts):
+            if call_arguments_matcher.match(call_arguments):
+                matches += calls_count
+        return matches
+
+
+RECORD_HEADER = struct.Struct("<I")
+
+
+class FileCallLog(CallLog):
+    def __init__(self, directory: Optional[str] = None, initial_size: int = mmap.PAGESIZE) -> None:
+        self.file: IO[bytes] = tempfile.TemporaryFile(dir=directory)
+        self.file.truncate(initial_size)
+        self.buffer = mmap.mmap(self.file.fileno(), initial_size)
+        self.size = 0
+        self.calls_count = 0
+        # arguments compared by identity or which can not be pickled
+        self.references: List[Any] = []
+        self._finalizer = weakref.finalize(self, _close_file_call_log, self.buffer, self.file)
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        record = self._dump((call_arguments.args, call_arguments.kwargs))
+        end = self.size + RECORD_HEADER.size + len(record)
+        if end > len(self.buffer):
+            self._grow(end)
+        RECORD_HEADER.pack_into(self.buffer, self.size, len(record))
+        self.buffer[self.size + RECORD_HEADER.size : end] = record
+        self.size = end
+        self.calls_count += 1
+
+    def _dump(self, record: tuple) -> bytes:
+        references_count = len(self.references)
+        stream = io.BytesIO()
+        try:
+            RecordPickler(stream, self.references).dump(record)
+        except Exception:  # pylint: disable=broad-except
+            # e.g. lambda - arguments which can not be pickled are kept in memory instead
+            del self.references[references_count:]
+            stream = io.BytesIO()
+            RecordPickler(stream, self.references, reference=record).dump(record)
+        return stream.getvalue()
+
+    def _grow(self, min_size: int) -> None:
+        size = max(len(self.buffer) * 2, min_size)
+        self.buffer.close()
+        self.file.truncate(size)
+        self.buffer = mmap.mmap(self.file.fileno(), size)
+        self._finalizer.detach()
+        self._finalizer = weakref.finalize(self, _close_file_call_log, self.buffer, self.file)
+
+    def count(self) -> int:
+        return self.calls_count
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        offset = 0
+        while offset < self.size:
+            (length,) = RECORD_HEADER.unpack_from(self.buffer, offset)
+            offset += RECORD_HEADER.size
+            args, kwargs = RecordUnpickler(io.BytesIO(self.buffer[offset : offset + length]), self.references).load()
+            offset += length
+            yield CallArguments(args=args, kwargs=kwargs)
+
+    def clear(self) -> None:
+        self.size = 0
+        self.calls_count = 0
+        self.references.clear()
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+class RecordPickler(pickle.Pickler):
+    def __init__(self, file: IO[bytes], references: List[Any], reference: Any = None) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.references = references
+        self.reference = reference
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        if obj is self.reference or (type(obj) not in LITERAL_TYPES and type(obj).__eq__ is object.__eq__):
+            # a copy of such argument would not be equal to the original one
+            self.references.append(obj)
+            return len(self.references) - 1
+        return None
+
+
+class RecordUnpickler(pickle.Unpickler):
+    def __init__(self, file: IO[bytes], references: List[Any]) -> None:
+        super().__init__(file)
+        self.references = references
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self.references[pid]
+
+
+def _close_file_call_log(buffer: mmap.mmap, file: IO[bytes]) -> None:
+    buffer.close()
+    file.close()
+
+
+COLUMN_TYPECODES = {int: "q", float: "d"}
+COLUMN_TYPES = {typecode: type_ for type_, typecode in COLUMN_TYPECODES.items()}
+
+
+class ColumnarCallLog(CallLog):
+    def __init__(self) -> None:
+        self.target: Any = None
+        # numbers are stored in typed arrays, other values in lists
+        self.columns: List[Any] = []
+        self.typecodes: List[Optional[str]] = []
+        self.calls_count = 0
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        if self.calls_count == 0:
+            self.target = call_arguments.target
+            self.typecodes = [COLUMN_TYPECODES.get(type(value)) for value in values]
+            self.columns = [array.array(typecode) if typecode else [] for typecode in self.typecodes]
+        for index, value in enumerate(values):
+            typecode = self.typecodes[index]
+            if typecode is not None:
+                if type(value) is not COLUMN_TYPES[typecode]:
+                    self._convert_to_objects(index)
+                else:
+                    try:
+                        self.columns[index].append(value)
+                        continue
+                    except OverflowError:
+                        self._convert_to_objects(index)
+            self.columns[index].append(value)
+        self.calls_count += 1
+
+    def _convert_to_objects(self, index: int) -> None:
+        self.columns[index] = list(self.columns[index])
+        self.typecodes[index] = None
+
+    def count(self) -> int:
+        return self.calls_count
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        for values in zip(*self.columns) if self.columns else ((),) * self.calls_count:
+            yield CallArguments.from_values(self.target, values)
+
+    def clear(self) -> None:
+        self.target = None
+        self.columns = []
+        self.typecodes = []
+        self.calls_count = 0
+
+    def count_matching(self, call_arguments_matcher: CallArgumentsMatcher) -> int:
+        mask = self._get_mask(call_arguments_matcher)
+        if mask is None:
+            return super().count_matching(call_arguments_matcher)
+        if mask is True:
+            return self.calls_count
+        return int(mask.sum())
+
+    def _get_mask(self, call_arguments_matcher: CallArgumentsMatcher) -> Any:
+        if self.calls_count == 0 or not isinstance(call_arguments_matcher, SpecificCallArgumentsMatcher):
+            return None
+        try:
+            import numpy  # type: ignore # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return None
+        mask: Any = True
+        for matcher, column, typecode in zip(call_arguments_matcher.matchers, self.columns, self.typecodes):
+            if isinstance(matcher, AnyValueMatcher):
+                continue
+            if typecode is None:
+                return None
+            column_mask = matcher.to_mask(numpy.frombuffer(column, dtype=typecode))
+            if column_mask is None:
+                return None
+            mask = mask & column_mask
+        return mask
+
+
+MAX_BUFFERED_CALLS = 1024
+
+
+class ThreadSafeCallLog(CallLog):
+    def __init__(self, call_log: CallLog) -> None:
+        self.call_log = call_log
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.buffers: List[Tuple["weakref.ref[threading.Thread]", Deque[Tuple[CallArguments, tuple]]]] = []
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        if not self.call_log.stores_arguments:
+            # there is nothing worth buffering, so arguments are not kept alive
+            with self.lock:
+                self.call_log.append(call_arguments, values)
+            return
+        try:
+            buffer = self.local.buffer
+        except AttributeError:
+            buffer = self.local.buffer = collections.deque()
+            with self.lock:
+                self.buffers.append((weakref.ref(threading.current_thread()), buffer))
+        buffer.append((call_arguments, values))
+        if len(buffer) >= MAX_BUFFERED_CALLS:
+            with self.lock:
+                self._flush()
+
+    def _flush(self) -> None:
+        buffers = []
+        for thread, buffer in self.buffers:
+            # buffer of thread which finished before it was merged will not be appended anymore
+            if _is_alive(thread):
+                buffers.append((thread, buffer))
+            # buffers are only appended by their threads, so popping them here is safe
+            while buffer:
+                call_arguments, values = buffer.popleft()
+                self.call_log.append(call_arguments, values)
+        self.buffers = buffers
+
+    def count(self) -> int:
+        with self.lock:
+            self._flush()
+            return self.call_log.count()
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        with self.lock:
+            self._flush()
+            return iter(list(self.call_log))
+
+    def count_matching(self, call_arguments_matcher: CallArgumentsMatcher) -> int:
+        with self.lock:
+            self._flush()
+            return self.call_log.count_matching(call_arguments_matcher)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.buffers = [(thread, buffer) for thread, buffer in self.buffers if _is_alive(thread)]
+            for _, buffer in self.buffers:
+                buffer.clear()
+            self.call_log.clear()
+
+
+def _is_alive(thread: "weakref.ref[threading.Thread]") -> bool:
+    referent = thread()
+    return referent is not None and referent.is_alive()
+
+
+class RetainingCallLog(CallLog):
+    def __init__(self, call_log: CallLog, retention: Retention) -> None:
+        self.call_log = call_log
+        self.retention = retention
+
+    def append(self, call_arguments: CallArguments, values: tuple) -> None:
+        retain = self.retention.retain
+        retained_call_arguments = CallArguments(
+            args=tuple(retain(arg) for arg in call_arguments.args),
+            kwargs={name: retain(value) for name, value in call_arguments.kwargs.items()},
+        )
+        target = call_arguments.target
+        if target is None:
+            self.call_log.append(retained_call_arguments, tuple(retain(value) for value in values))
+            return
+        # values are bound again instead of being retained separately, so each argument is retained once
+        self.call_log.append(retained_call_arguments, retained_call_arguments.bind(target))
+
+    def count(self) -> int:
+        return self.call_log.count()
+
+    def __iter__(self) -> Iterator[CallArguments]:
+        if not self.retention.restores_values:
+            return iter(self.call_log)
+        return (self._restore(call_arguments) for call_arguments in self.call_log)
+
+    def _restore(self, call_arguments: CallArguments) -> CallArguments:
+        restore = self.retention.restore
+        args = tuple(restore(arg) for arg in call_arguments.args)
+        kwargs = {name: restore(value) for name, value in call_arguments.kwargs.items()}
+        restored_call_arguments = CallArguments(args=args, kwargs=kwargs)
+        if call_arguments.target is not None:
+            restored_call_arguments.bind(call_arguments.target)
+        return restored_call_arguments
+
+    def clear(self) -> None:
+        self.call_log.clear()
+
+    def count_matching(self, call_arguments_matcher: CallArgumentsMatcher) -> int:
+        if self.retention.restores_values:
+            return super().count_matching(call_arguments_matcher)
+        # retained values are matched as they are, so optimizations of wrapped call log are used
+        return self.call_log.count_matching(call_arguments_matcher)
+
+
+def create_thread_safe_call_log(call_log: CallLog) -> CallLog:
+    if isinstance(call_log, RetainingCallLog):
+        # arguments are retained by calling thread, so buffered calls do not keep them alive
+        return RetainingCallLog(create_thread_safe_call_log(call_log.call_log), call_log.retention)
+    return ThreadSafeCallLog(call_log)
+
+
+class Recording:
+    def __init__(self, call_log_factory: Callable[[], CallLog], timeline: bool = False) -> None:
+        self.call_log_factory = call_log_factory
+        self.timeline = timeline
+
+    def create_call_log(self) -> CallLog:
+        return self.call_log_factory()
+
+    def create_timeline(self) -> Optional[Timeline]:
+        return Timeline() if self.timeline else None
+
+    def thread_safe(self) -> "Recording":
+        return Recording(lambda: create_thread_safe_call_log(self.create_call_log()), timeline=self.timeline)
+
+    def with_timeline(self) -> "Recording":
+        return Recording(self.call_log_factory, timeline=True)
+
+    def with_retention(self, retention: Retention) -> "Recording":
+        return Recording(lambda: RetainingCallLog(self.create_call_log(), retention), timeline=self.timeline)
+
+    @classmethod
+    def full(cls) -> "Recording":
+        return cls(FullCallLog)
+
+    @classmethod
+    def last(cls, calls: int) -> "Recording":
+        return cls(functools.partial(BoundedCallLog, calls))
+
+    @classmethod
+    def interned(cls) -> "Recording":
+        return cls(InternedCallLog)
+
+    @classmethod
+    def file(cls, directory: Optional[str] = None) -> "Recording":
+        return cls(functools.partial(FileCallLog, directory))
+
+    @classmethod
+    def columnar(cls) -> "Recording":
+        return cls(ColumnarCallLog)
+
+    @classmethod
+    def counts(cls) -> "Recording":
+        return cls(CountingCallLog)
+
+    @classmethod
+    def off(cls) -> "Recording":
+        return cls(DisabledCallLog)
@@ -0,0 +1,78 @@
+import abc
+import weakref
+from typing import Any
+
+from mimid.digest import Fingerprint, get_size
+
+
+class Retention(abc.ABC):
+    restores_values = False
+
+    @abc.abstractmethod
+    def retain(self, value: Any) -> Any:
+        pass
+
+    def restore(self, value: Any) -> Any:
+        return value
+
+    @classmethod
+    def full(cls) -> "Retention":
+        return FullRetention()
+
+    @classmethod
+    def weak(cls) -> "Retention":
+        return WeakRetention()
+
+    @classmethod
+    def fingerprints(cls, min_size: int = 1024) -> "Retention":
+        return FingerprintRetention(min_size)
+
+
+class FullRetention(Retention):
+    def retain(self, value: Any) -> Any:
+        return value
+
+
+class DeadReference:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "DEAD_REFERENCE"
+
+
+DEAD_REFERENCE = DeadReference()
+
+
+class WeakArgument:
+    __slots__ = ("reference",)
+
+    def __init__(self, reference: "weakref.ref[Any]") -> None:
+        self.reference = reference
+
+
+class WeakRetention(Retention):
+    restores_values = True
+
+    def retain(self, value: Any) -> Any:
+        try:
+            return WeakArgument(weakref.ref(value))
+        except TypeError:
+            # e.g. numbers, strings and tuples can not be weakly referenced
+            return value
+
+    def restore(self, value: Any) -> Any:
+        if type(value) is WeakArgument:
+            referent = value.reference()
+            return DEAD_REFERENCE if referent is None else referent
+        return value
+
+
+class FingerprintRetention(Retention):
+    def __init__(self, min_size: int) -> None:
+        self.min_size = min_size
+
+    def retain(self, value: Any) -> Any:
+        size = get_size(value)
+        if size is None or size < self.min_size:
+            return value
+        return Fingerprint.create(value)
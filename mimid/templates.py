@@ -0,0 +1,31 @@
+from typing import Generic, TypeVar, cast
+
+from mimid.configuration import Mock
+
+T = TypeVar("T")
+
+
+class MockTemplate(Generic[T]):
+    def __init__(self, mock: Mock) -> None:
+        self.mock = clone_mock(mock)
+
+    def create(self) -> T:
+        return cast(T, clone_mock(self.mock))
+
+
+def clone_mock(mock: Mock) -> Mock:
+    clone = type(mock)(
+        mock.target,
+        recording=mock.recording,
+        mock_callable=mock.mock_callable.clone(
+            call_log=mock.recording.create_call_log(), timeline=mock.recording.create_timeline()
+        ),
+    )
+    clone.mock_attr_callable = {
+        attr: mock_callable.clone(call_log=mock.recording.create_call_log(), timeline=mock.recording.create_timeline())
+        for attr, mock_callable in mock.mock_attr_callable.items()
+    }
+    clone.property_configurations = {
+        property_: call_configuration.copy() for property_, call_configuration in mock.property_configurations.items()
+    }
+    return clone
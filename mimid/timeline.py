@@ -0,0 +1,81 @@
+import array
+import bisect
+import threading
+from typing import List
+
+NANOSECONDS = 1_000_000_000
+
+
+class Timeline:
+    __slots__ = ("timestamps", "durations", "lock")
+
+    def __init__(self) -> None:
+        self.timestamps = array.array("q")
+        self.durations = array.array("q")
+        self.lock = threading.Lock()
+
+    def append(self, timestamp: int, duration: int) -> None:
+        with self.lock:
+            self.timestamps.append(timestamp)
+            self.durations.append(duration)
+
+    def count(self) -> int:
+        return len(self.timestamps)
+
+    def clear(self) -> None:
+        with self.lock:
+            del self.timestamps[:]
+            del self.durations[:]
+
+    def calls_per_second(self) -> float:
+        timestamps = self._sorted_timestamps()
+        if len(timestamps) < 2 or timestamps[-1] == timestamps[0]:
+            return float(len(timestamps))
+        return (len(timestamps) - 1) * NANOSECONDS / (timestamps[-1] - timestamps[0])
+
+    def max_calls_in_window(self, window: float = 1.0) -> int:
+        timestamps = self._sorted_timestamps()
+        window_ns = int(window * NANOSECONDS)
+        max_calls = 0
+        start = 0
+        for end, timestamp in enumerate(timestamps):
+            while timestamp - timestamps[start] >= window_ns:
+                start += 1
+            max_calls = max(max_calls, end - start + 1)
+        return max_calls
+
+    def max_concurrency(self) -> int:
+        with self.lock:
+            starts = sorted(self.timestamps)
+            ends = sorted(timestamp + duration for timestamp, duration in zip(self.timestamps, self.durations))
+        max_concurrency = 0
+        for index, start in enumerate(starts):
+            # calls started so far minus calls ended before this one started
+            max_concurrency = max(max_concurrency, index + 1 - bisect.bisect_right(ends, start))
+        return max_concurrency
+
+    def duration_percentile(self, percent: float) -> float:
+        with self.lock:
+            durations = sorted(self.durations)
+        return _percentile(durations, percent) / NANOSECONDS
+
+    def inter_arrival_percentile(self, percent: float) -> float:
+        timestamps = self._sorted_timestamps()
+        intervals = sorted(second - first for first, second in zip(timestamps, timestamps[1:]))
+        return _percentile(intervals, percent) / NANOSECONDS
+
+    def _sorted_timestamps(self) -> List[int]:
+        # calls from many threads may be appended out of order
+        with self.lock:
+            return sorted(self.timestamps)
+
+
+def _percentile(values: List[int], percent: float) -> float:
+    if not values:
+        raise ValueError("No calls in timeline")
+    if not 0 <= percent <= 100:
+        raise ValueError("Percent should be between 0 and 100")
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
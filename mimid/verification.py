@@ -1,9 +1,13 @@
+import asyncio
+import threading
+import time
 from typing import Union
 
 from mimid.common import CallArguments
 from mimid.configuration import MockCallable
-from mimid.exceptions import WrongNumberOfCallsException
+from mimid.exceptions import WrongNumberOfCallsException, CallsNotRecordedException
 from mimid.matchers.call import SpecificCallArgumentsMatcher, AnyCallArgumentsMatcher, CallArgumentsMatcher
+from mimid.digest import digest_cache
 from mimid.matchers.value import ValueMatcher, gt
 
 
@@ -19,10 +23,81 @@ class MockAttributeVerifier:
         return self
 
     def called(self, times: Union[int, ValueMatcher] = gt(0)):
+        if not self._match_calls(ValueMatcher.from_maybe_value(times)):
+            raise WrongNumberOfCallsException()
+
+    def called_within(self, timeout: float, times: Union[int, ValueMatcher] = gt(0)) -> None:
+        times_matcher = ValueMatcher.from_maybe_value(times)
+        deadline = time.monotonic() + timeout
+        condition = threading.Condition()
+
+        def notify() -> None:
+            with condition:
+                condition.notify_all()
+
+        self.mock_callable.waiters.append(notify)
+        try:
+            with condition:
+                while not self._match_calls(times_matcher):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise WrongNumberOfCallsException()
+                    condition.wait(remaining)
+        finally:
+            self.mock_callable.waiters.remove(notify)
+
+    async def called_within_async(self, timeout: float, times: Union[int, ValueMatcher] = gt(0)) -> None:
         times_matcher = ValueMatcher.from_maybe_value(times)
-        matches = 0
-        for call_arguments in self.mock_callable.calls_arguments:
-            if self.call_arguments_matcher.match(call_arguments):
-                matches += 1
-        if not times_matcher(matches):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        event = asyncio.Event()
+
+        def notify() -> None:
+            # mock can be called from other threads
+            loop.call_soon_threadsafe(event.set)
+
+        self.mock_callable.waiters.append(notify)
+        try:
+            while True:
+                event.clear()
+                if self._match_calls(times_matcher):
+                    return
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise WrongNumberOfCallsException()
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.mock_callable.waiters.remove(notify)
+
+    def called_at_rate(self, times: Union[int, ValueMatcher], window: float = 1.0) -> None:
+        timeline = self.mock_callable.timeline
+        if timeline is None:
+            raise CallsNotRecordedException("calls timeline is disabled")
+        if not isinstance(self.call_arguments_matcher, AnyCallArgumentsMatcher):
+            raise CallsNotRecordedException("calls timeline does not record arguments")
+        if not ValueMatcher.from_maybe_value(times)(timeline.max_calls_in_window(window)):
             raise WrongNumberOfCallsException()
+
+    def _match_calls(self, times_matcher: ValueMatcher) -> bool:
+        stats = self.mock_callable.stats
+        if stats is None:
+            return self._match_recorded_calls(times_matcher)
+        start = time.perf_counter_ns()
+        try:
+            return self._match_recorded_calls(times_matcher)
+        finally:
+            stats.add_verification(time.perf_counter_ns() - start)
+
+    def _match_recorded_calls(self, times_matcher: ValueMatcher) -> bool:
+        call_log = self.mock_callable.call_log
+        if isinstance(self.call_arguments_matcher, AnyCallArgumentsMatcher):
+            matches = call_log.count()
+        else:
+            try:
+                matches = call_log.count_matching(self.call_arguments_matcher)
+            finally:
+                digest_cache.clear()
+        return times_matcher(matches)
@@ -27,5 +27,8 @@ setup(
     python_requires=">=3.6",
     keywords="testing mocking",
     packages=["mimid", "mimid.matchers"],
-    extras_require={"dev": ["pytest>=4", "pytest-cov", "coveralls", "black", "mypy", "pylint"]},
+    extras_require={
+        "dev": ["pytest>=4", "pytest-cov", "coveralls", "black", "mypy", "pylint", "numpy"],
+        "numpy": ["numpy"],
+    },
 )
@@ -0,0 +1,145 @@
+import pytest
+
+from mimid import mock, every, verify, eq, CallNotConfiguredException, Recording, Retention
+from mimid import digest
+from mimid.matchers.array import digest_eq, allclose, array_like
+from mimid.matchers.value import array_eq, ValueMatcher, ArrayEqualValueMatcher
+from tests.targets import function
+
+
+def test_digest_eq():
+    matcher = digest_eq(b"abc")
+
+    assert matcher(b"abc")
+    assert matcher(bytearray(b"abc"))
+    assert matcher(memoryview(b"xabcx")[1:4])
+    assert not matcher(b"abd")
+    assert not matcher(b"abcd")
+    assert not matcher("abc")
+    assert not matcher(None)
+
+
+def test_digest_eq_matches_not_contiguous_memoryview():
+    matcher = digest_eq(b"ace")
+
+    assert matcher(memoryview(b"abcde")[::2])
+
+
+def test_digest_eq_raises_exception_when_value_is_not_buffer():
+    with pytest.raises(TypeError):
+        digest_eq("abc")
+
+
+def test_digest_eq_computes_digest_of_the_same_bytes_once(monkeypatch):
+    computed = []
+    compute_digest = digest.compute_digest
+    monkeypatch.setattr(digest, "compute_digest", lambda value: computed.append(value) or compute_digest(value))
+    value = bytes(bytearray(b"abc" * 1000))
+    first = digest_eq(b"abd" * 1000)
+    second = digest_eq(b"abc" * 1000)
+
+    assert not first(value)
+    assert second(value)
+    assert len([computed_value for computed_value in computed if computed_value is value]) == 1
+
+
+def test_digest_cache_does_not_keep_bytes_after_call_and_verification():
+    func = mock(function, recording=Recording.full().with_retention(Retention.fingerprints()))
+    every(func).with_args(digest_eq(b"a" * 2048)).returns(1)
+    every(func).returns(2)
+    payload = b"b" * 2048
+
+    func(payload)
+    entry_after_call = digest.digest_cache.entry
+    verify(func).with_args(digest_eq(payload)).called(times=1)
+
+    assert entry_after_call is None
+    assert digest.digest_cache.entry is None
+
+
+def test_digest_eq_does_not_reuse_digest_of_mutable_buffer():
+    matcher = digest_eq(b"abc")
+    value = bytearray(b"abc")
+    matcher(value)
+
+    value[0] = ord("x")
+
+    assert not matcher(value)
+
+
+def test_array_eq():
+    numpy = pytest.importorskip("numpy")
+    matcher = array_eq(numpy.array([1, 2, 3]))
+
+    assert matcher(numpy.array([1, 2, 3]))
+    assert not matcher(numpy.array([1, 2, 4]))
+    assert not matcher(numpy.array([1, 2]))
+
+
+def test_allclose():
+    numpy = pytest.importorskip("numpy")
+    matcher = allclose(numpy.array([1.0, 2.0]), atol=0.1)
+
+    assert matcher(numpy.array([1.05, 1.95]))
+    assert not matcher(numpy.array([1.2, 2.0]))
+    assert not matcher(numpy.array([1.0]))
+    assert not matcher(numpy.array([[1.0, 2.0], [1.0, 2.0]]))
+
+
+def test_array_like():
+    numpy = pytest.importorskip("numpy")
+    matcher = array_like(shape=(None, 3), dtype="float32")
+
+    assert matcher(numpy.zeros((2, 3), dtype="float32"))
+    assert not matcher(numpy.zeros((2, 3), dtype="float64"))
+    assert not matcher(numpy.zeros((2, 4), dtype="float32"))
+    assert not matcher(numpy.zeros(3, dtype="float32"))
+    assert not matcher([1, 2, 3])
+
+
+def test_from_maybe_value_creates_array_eq_matcher_for_array():
+    numpy = pytest.importorskip("numpy")
+
+    matcher = ValueMatcher.from_maybe_value(numpy.array([1, 2]))
+
+    assert isinstance(matcher, ArrayEqualValueMatcher)
+
+
+def test_mock_function_call_returns_configured_value_when_called_with_matching_array():
+    numpy = pytest.importorskip("numpy")
+    func = mock(function)
+    every(func).with_args(numpy.array([1, 2])).returns(1)
+    every(func).with_args(array_like(shape=(3,))).returns(2)
+
+    assert func(numpy.array([1, 2])) == 1
+    assert func(numpy.array([1, 2, 3])) == 2
+    verify(func).with_args(numpy.array([1, 2])).called(times=1)
+
+
+def test_eq_matches_array_argument():
+    numpy = pytest.importorskip("numpy")
+
+    assert eq(numpy.array([1, 2]))(numpy.array([1, 2]))
+    assert not eq(numpy.array([1, 2]))(numpy.array([1, 3]))
+    assert not eq(0)(numpy.array([0, 0]))
+    assert not eq([0, 0])(numpy.array([0, 0, 0]))
+
+
+def test_mock_function_call_raises_exception_when_called_with_array_not_matching_configured_value():
+    numpy = pytest.importorskip("numpy")
+    func = mock(function)
+    every(func).with_args(0).returns(1)
+
+    with pytest.raises(CallNotConfiguredException):
+        func(numpy.arange(3))
+
+
+def test_mock_function_verify_does_not_raise_exception_when_function_called_with_array():
+    numpy = pytest.importorskip("numpy")
+    func = mock(function)
+    every(func).returns(1)
+
+    func(numpy.arange(3))
+
+    verify(func).with_args(5).called(times=0)
+    verify(func).with_args(eq(numpy.arange(3))).called(times=1)
@@ -1,6 +1,6 @@
 from mimid.common import CallArguments
-from mimid.matchers.call import SpecificCallArgumentsMatcher
-from mimid.matchers.value import eq
+from mimid.matchers.call import SpecificCallArgumentsMatcher, TableCallArgumentsMatcher
+from mimid.matchers.value import eq, gt, EqualValueMatcher
 
 
 def func_without_params():
@@ -11,6 +11,10 @@ def func_with_one_param(param):
     pass
 
 
+def func_with_two_params(first, second):
+    pass
+
+
 def test_match_with_empty_args_kwargs_and_matching_matcher():
     call_args = CallArguments(args=(), kwargs={})
     call_args_matcher = SpecificCallArgumentsMatcher(
@@ -90,3 +94,64 @@ def test_match_with_matching_kwargs_call_and_args_configuration():
     )
 
     assert call_args_matcher.match(call_args)
+
+
+def test_matchers_are_compiled_once_in_signature_order():
+    call_args_matcher = SpecificCallArgumentsMatcher(
+        target=func_with_two_params, arguments=CallArguments(args=(), kwargs={"second": eq(2), "first": 1})
+    )
+
+    first_matcher, second_matcher = call_args_matcher.matchers
+    assert isinstance(first_matcher, EqualValueMatcher) and first_matcher.value == 1
+    assert isinstance(second_matcher, EqualValueMatcher) and second_matcher.value == 2
+
+
+def test_match_values_with_matching_normalized_values():
+    call_args_matcher = SpecificCallArgumentsMatcher(
+        target=func_with_two_params, arguments=CallArguments(args=(1,), kwargs={"second": gt(0)})
+    )
+
+    assert call_args_matcher.match_values((1, 2))
+    assert not call_args_matcher.match_values((1, -2))
+
+
+def test_match_values_returns_false_when_matcher_raises_type_error():
+    call_args_matcher = SpecificCallArgumentsMatcher(
+        target=func_with_one_param, arguments=CallArguments(args=(gt(0),), kwargs={})
+    )
+
+    assert not call_args_matcher.match_values(("text",))
+
+
+def test_key_is_set_when_all_matchers_are_equal_to_literals():
+    call_args_matcher = SpecificCallArgumentsMatcher(
+        target=func_with_two_params, arguments=CallArguments(args=(1,), kwargs={"second": eq("a")})
+    )
+
+    assert call_args_matcher.key == (1, "a")
+
+
+def test_key_is_not_set_when_any_matcher_is_not_equal_to_literal():
+    call_args_matcher = SpecificCallArgumentsMatcher(
+        target=func_with_two_params, arguments=CallArguments(args=(1, gt(0)), kwargs={})
+    )
+
+    assert call_args_matcher.key is None
+
+
+def func_with_default_param(param, other=0):
+    pass
+
+
+def test_table_matcher_normalizes_rows():
+    call_args_matcher = TableCallArgumentsMatcher(target=func_with_default_param, rows={1: "a", (2, 3): "b"})
+
+    assert call_args_matcher.results == {(1, 0): "a", (2, 3): "b"}
+
+
+def test_table_matcher_match_with_matching_and_not_matching_args():
+    call_args_matcher = TableCallArgumentsMatcher(target=func_with_two_params, rows=[((1, 2), "a")])
+
+    assert call_args_matcher.match(CallArguments(args=(1,), kwargs={"second": 2}))
+    assert not call_args_matcher.match(CallArguments(args=(2, 1), kwargs={}))
+    assert not call_args_matcher.match_values(([1], 2))
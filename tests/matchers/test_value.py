@@ -1,7 +1,25 @@
+import decimal
+import enum
+
 import pytest
 
 from mimid import ValueNotCapturedException
-from mimid.matchers.value import gt, eq, any, gte, lte, CaptureSlot, capture, lt
+from mimid.matchers.value import (
+    gt,
+    eq,
+    any,
+    gte,
+    lte,
+    CaptureSlot,
+    capture,
+    lt,
+    OrValueMatcher,
+    AndValueMatcher,
+    OneOfValueMatcher,
+    IntervalValueMatcher,
+    one_of,
+    in_ranges,
+)
 
 
 def test_any():
@@ -68,3 +86,231 @@ def test_not_matcher():
 
     assert not matcher(0)
     assert matcher(1)
+
+
+def test_or_matcher_is_flattened():
+    matcher = gt(5) | lt(0) | capture(CaptureSlot()) | gt(10)
+
+    assert isinstance(matcher, OrValueMatcher)
+    assert len(matcher.matchers) == 4
+
+
+def test_or_matcher_of_many_matchers_does_not_exceed_recursion_limit():
+    matcher = eq([0])
+    for value in range(1, 2000):
+        matcher = matcher | eq([value])
+
+    assert matcher([1999])
+    assert not matcher([2000])
+
+
+def test_or_matcher_of_eq_matchers_is_collapsed_to_one_of_matcher():
+    matcher = eq(0)
+    for value in range(1, 500):
+        matcher = matcher | eq(value)
+
+    assert isinstance(matcher, OneOfValueMatcher)
+    assert matcher(499)
+    assert matcher(1.0)
+    assert not matcher(500)
+    assert not matcher([1])
+
+
+def test_or_matcher_collapses_only_adjacent_eq_matchers():
+    slot = CaptureSlot()
+    matcher = eq(1) | capture(slot) | eq(2)
+
+    matcher(3)
+
+    assert isinstance(matcher, OrValueMatcher)
+    assert slot.value == 3
+
+
+def test_or_matcher_does_not_collapse_eq_matchers_of_not_literal_values():
+    class AlwaysEqual:
+        def __eq__(self, other):
+            return True
+
+    matcher = eq(1) | eq(AlwaysEqual())
+
+    assert isinstance(matcher, OrValueMatcher)
+    assert matcher(2)
+
+
+def test_one_of_matcher_compares_not_literal_values_with_eq():
+    class EqualToOne:
+        def __eq__(self, other):
+            return other == 1
+
+    matcher = eq(1) | eq(2)
+
+    assert matcher(EqualToOne())
+
+
+def test_one_of():
+    matcher = one_of(range(10000))
+
+    assert matcher(9999)
+    assert matcher(1.0)
+    assert not matcher(10000)
+    assert not matcher("1")
+
+
+def test_one_of_matches_not_hashable_values():
+    matcher = one_of([1, [2], {"a": 3}])
+
+    assert matcher(1)
+    assert matcher([2])
+    assert matcher({"a": 3})
+    assert not matcher([1])
+
+
+def test_one_of_matches_not_literal_hashable_values_without_comparing_all_values():
+    class Number(int):
+        comparisons = 0
+
+        def __eq__(self, other):
+            Number.comparisons += 1
+            return int(self) == other
+
+        __hash__ = int.__hash__
+
+    class Color(enum.IntEnum):
+        RED = 1
+
+    matcher = one_of(range(10000))
+
+    assert matcher(Number(5))
+    assert not matcher(Number(10000))
+    assert matcher(Color.RED)
+    assert matcher(decimal.Decimal(9999))
+    assert Number.comparisons <= 1
+
+
+def test_one_of_is_merged_with_adjacent_eq_matcher():
+    matcher = one_of([1, 2]) | eq(3)
+
+    assert isinstance(matcher, OneOfValueMatcher)
+    assert matcher.values == {1, 2, 3}
+
+
+def test_in_ranges():
+    matcher = in_ranges((10, 20), (0, 5), (30, 40))
+
+    assert matcher(0)
+    assert matcher(5)
+    assert matcher(15.5)
+    assert matcher(40)
+    assert not matcher(-1)
+    assert not matcher(7)
+    assert not matcher(41)
+
+
+def test_in_ranges_merges_overlapping_ranges():
+    matcher = in_ranges((0, 10), (5, 20), (20, 25), (30, 40))
+
+    assert matcher.lows == [0, 30]
+    assert matcher.highs == [25, 40]
+
+
+def test_in_ranges_raises_exception_when_range_is_invalid():
+    with pytest.raises(ValueError):
+        in_ranges((0, 10), (5, 1))
+
+
+def test_and_matcher_of_bounds_is_collapsed_to_interval_matcher():
+    matcher = gt(0) & lte(10) & gte(2) & lt(20)
+
+    assert isinstance(matcher, IntervalValueMatcher)
+    assert matcher(2)
+    assert matcher(10)
+    assert not matcher(1)
+    assert not matcher(10.5)
+
+
+def test_and_matcher_prefers_exclusive_bound_when_bounds_are_equal():
+    matcher = gte(0) & gt(0) & lt(5) & lte(5)
+
+    assert not matcher(0)
+    assert not matcher(5)
+    assert matcher(1)
+
+
+def test_and_matcher_is_flattened():
+    matcher = gt(0) & capture(CaptureSlot()) & (lt(5) & ~eq(3))
+
+    assert isinstance(matcher, AndValueMatcher)
+    assert len(matcher.matchers) == 4
+    assert matcher(1)
+    assert not matcher(3)
+
+
+def test_not_matcher_of_not_matcher_is_original_matcher():
+    matcher = gt(0)
+
+    assert ~~matcher is matcher
+
+
+def test_collapsed_matchers_compile_to_mask():
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([0, 1, 2, 3, 4])
+
+    mask = (eq(1) | eq(3) | (gt(3) & lte(4))).to_mask(values)
+
+    assert mask.tolist() == [False, True, False, True, True]
+
+
+def test_matchers_do_not_have_instance_dict():
+    matchers = [
+        any(),
+        eq(0),
+        gt(0),
+        gte(0),
+        lt(0),
+        lte(0),
+        capture(CaptureSlot()),
+        eq(0) | eq(1),
+        eq(0) & eq(1),
+        ~eq(0),
+        one_of([0, [1]]),
+        in_ranges((0, 1)),
+    ]
+
+    for matcher in matchers:
+        assert not hasattr(matcher, "__dict__")
+
+
+def test_comparison_matchers_compile_to_mask():
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([0, 1, 2, 3])
+
+    mask = ((gt(0) & lte(2)) | eq(3)).to_mask(values)
+
+    assert mask.tolist() == [False, True, True, True]
+
+
+def test_not_matcher_compiles_to_negated_mask():
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([0.5, 1.5])
+
+    mask = (~lt(1)).to_mask(values)
+
+    assert mask.tolist() == [False, True]
+
+
+def test_matcher_does_not_compile_to_mask_when_value_is_not_number():
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([0, 1])
+
+    assert (eq(0) | eq("a")).to_mask(values) is None
+    assert gt(2**64).to_mask(values) is None
+    assert capture(CaptureSlot()).to_mask(values) is None
+
+
+def test_set_and_ranges_matchers_compile_to_mask():
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([0, 1, 2, 3, 4, 5])
+
+    assert one_of([1, 4]).to_mask(values).tolist() == [False, True, False, False, True, False]
+    assert in_ranges((0, 1), (3, 4)).to_mask(values).tolist() == [True, True, False, True, True, False]
+    assert one_of([1, [4]]).to_mask(values) is None
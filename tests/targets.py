@@ -5,6 +5,9 @@ class A:
     def method(self, param: int) -> int:
         return param
 
+    async def async_method(self, param: int) -> int:
+        return param
+
     @property
     def prop(self):
         return None
@@ -16,3 +19,15 @@ def function(param: int) -> int:
 
 class Error(Exception):
     pass
+
+
+def function_with_default(param: int, other: int = 0) -> int:
+    return param + other
+
+
+def function_with_two_params(first: int, second: int) -> int:
+    return first + second
+
+
+async def async_function(param: int) -> int:
+    return param
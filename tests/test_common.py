@@ -0,0 +1,131 @@
+import gc
+import inspect
+
+import pytest
+
+from mimid.common import CallArguments, get_signature, get_binder, create_binder, is_literal, _signatures
+
+
+def test_get_signature_returns_signature_of_target():
+    def func(param):
+        pass
+
+    signature = get_signature(func)
+
+    assert signature == inspect.signature(func)
+
+
+def test_get_signature_returns_cached_signature_for_the_same_target():
+    def func(param):
+        pass
+
+    signature = get_signature(func)
+
+    assert get_signature(func) is signature
+
+
+def test_get_signature_evicts_cached_signature_when_target_is_collected():
+    def func(param):
+        pass
+
+    get_signature(func)
+    assert func in _signatures
+
+    del func
+    gc.collect()
+
+    assert not any(target.__name__ == "func" for target in _signatures.keys())
+
+
+def test_get_signature_works_with_not_weakly_referenceable_target():
+    signature = get_signature(len)
+
+    assert list(signature.parameters) == ["obj"]
+
+
+def test_get_binder_returns_cached_binder_for_the_same_target():
+    def func(param):
+        pass
+
+    binder = get_binder(func)
+
+    assert get_binder(func) is binder
+
+
+def test_create_binder_normalizes_args_and_kwargs_into_tuple():
+    def func(a, b, c):
+        pass
+
+    binder = create_binder(inspect.signature(func))
+
+    assert binder(1, 2, 3) == (1, 2, 3)
+    assert binder(1, c=3, b=2) == (1, 2, 3)
+
+
+def test_create_binder_applies_defaults():
+    def func(a, b=2, *, c=3):
+        pass
+
+    binder = create_binder(inspect.signature(func))
+
+    assert binder(1) == (1, 2, 3)
+    assert binder(1, c=4) == (1, 2, 4)
+
+
+def test_create_binder_collects_var_positional_and_var_keyword_arguments():
+    def func(a, *args, b, **kwargs):
+        pass
+
+    binder = create_binder(inspect.signature(func))
+
+    assert binder(1, 2, 3, b=4, c=5) == (1, (2, 3), 4, {"c": 5})
+
+
+def test_create_binder_supports_positional_only_parameters():
+    signature = inspect.Signature(
+        [
+            inspect.Parameter("a", inspect.Parameter.POSITIONAL_ONLY),
+            inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD),
+        ]
+    )
+
+    binder = create_binder(signature)
+
+    assert binder(1, a=2) == (1, {"a": 2})
+
+
+def test_create_binder_raises_type_error_when_arguments_do_not_match_signature():
+    def func(a):
+        pass
+
+    binder = create_binder(inspect.signature(func))
+
+    with pytest.raises(TypeError):
+        binder(1, b=2)
+    with pytest.raises(TypeError):
+        binder()
+
+
+def test_create_binder_does_not_clash_with_parameter_names():
+    def func(bind, __mimid_default_0=1):
+        pass
+
+    binder = create_binder(inspect.signature(func), name="bind")
+
+    assert binder(1) == (1, 1)
+
+
+def test_is_literal():
+    assert is_literal(1)
+    assert is_literal("text")
+    assert is_literal(None)
+    assert is_literal((1, ("a", b"b"), frozenset({1.5})))
+    assert not is_literal(float("nan"))
+    assert not is_literal([1])
+    assert not is_literal((1, object()))
+
+
+def test_call_arguments_does_not_have_instance_dict():
+    call_arguments = CallArguments(args=(), kwargs={})
+
+    assert not hasattr(call_arguments, "__dict__")
@@ -1,7 +1,26 @@
+import asyncio
+import itertools
+import threading
+
 import pytest
 
-from mimid import mock, every, prop, CallNotConfiguredException, gt, lt, slot, capture, NotMatchingSignatureException
-from tests.targets import A, Error, function
+from mimid import (
+    mock,
+    every,
+    prop,
+    CallNotConfiguredException,
+    gt,
+    lt,
+    slot,
+    capture,
+    NotMatchingSignatureException,
+    one_of,
+    in_ranges,
+    Recording,
+)
+from mimid.configuration import Mock
+from tests.targets import A, Error, function, function_with_default, function_with_two_params, async_function
+from tests.utils import run
 
 
 def test_mock_method_call_returns_configured_value():
@@ -144,6 +163,68 @@ def test_mock_function_call_returns_last_value_when_called_more_times():
     assert result == 2
 
 
+def test_mock_function_call_returns_values_from_generator_lazily():
+    consumed = []
+
+    def values():
+        for value in range(3):
+            consumed.append(value)
+            yield value
+
+    func = mock(function)
+    every(func).returns_many(values())
+
+    result = func(1)
+
+    assert result == 0
+    assert consumed == [0]
+
+
+def test_mock_function_call_returns_values_from_infinite_iterator():
+    func = mock(function)
+    every(func).returns_many(itertools.count())
+
+    results = [func(1) for _ in range(1000)]
+
+    assert results == list(range(1000))
+
+
+def test_mock_function_call_does_not_modify_provided_values():
+    values = [1, 2]
+    func = mock(function)
+    every(func).returns_many(values)
+    func(1)
+    func(1)
+
+    assert values == [1, 2]
+
+
+def test_mock_function_call_raises_exception_when_configured_with_empty_values():
+    func = mock(function)
+    every(func).returns_many([])
+
+    with pytest.raises(ValueError):
+        func(1)
+
+
+def test_mock_function_call_returns_each_value_from_generator_once_when_called_from_many_threads():
+    results = []
+    func = mock(function)
+    every(func).returns_many(iter(range(800)))
+
+    def call() -> None:
+        for _ in range(100):
+            results.append(func(1))
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == list(range(800))
+
+
 def test_mock_function_call_returns_result_of_provided_callable():
     func = mock(function)
     every(func).execute(lambda: 2)
@@ -176,6 +257,139 @@ def test_mock_function_call_returns_values_configured_with_matchers():
     assert result_2 == 2
 
 
+def test_mock_function_call_returns_values_configured_with_set_and_ranges_matchers():
+    func = mock(function)
+    every(func).with_args(one_of(range(1000))).returns(1)
+    every(func).with_args(in_ranges((-100, -1), (1000, 2000))).returns(2)
+
+    result_1 = func(999)
+    result_2 = func(1500)
+
+    assert result_1 == 1
+    assert result_2 == 2
+    with pytest.raises(CallNotConfiguredException):
+        func(3000)
+
+
+def test_mock_function_call_returns_configured_value_when_called_with_arguments_matching_after_applying_defaults():
+    func = mock(function_with_default)
+    every(func).with_args(1).returns(2)
+    every(func).with_args(1, 5).returns(3)
+
+    result_1 = func(1, other=0)
+    result_2 = func(param=1, other=5)
+
+    assert result_1 == 2
+    assert result_2 == 3
+
+
+def test_mock_function_call_returns_value_of_first_matching_configuration():
+    func = mock(function)
+    every(func).with_args(1).returns(1)
+    every(func).with_args(gt(0)).returns(2)
+    every(func).with_args(2).returns(3)
+    every(func).with_args(1).returns(4)
+
+    result_1 = func(1)
+    result_2 = func(2)
+
+    assert result_1 == 1
+    assert result_2 == 2
+
+
+def test_mock_function_call_returns_value_of_equal_configuration_when_called_with_non_literal_argument():
+    class AlwaysEqual:
+        def __eq__(self, other):
+            return True
+
+        def __hash__(self):
+            return 0
+
+    func = mock(function)
+    every(func).with_args(1).returns(2)
+
+    result = func(AlwaysEqual())
+
+    assert result == 2
+
+
+def test_mock_function_call_returns_value_of_equal_configuration_when_called_with_unhashable_argument():
+    func = mock(function)
+    every(func).with_args([1]).returns(2)
+    every(func).with_args(1).returns(3)
+
+    result = func([1])
+
+    assert result == 2
+
+
+def test_mock_function_call_returns_value_from_configured_table():
+    func = mock(function_with_two_params)
+    every(func).with_table({(1, 2): 3, (2, 3): 5})
+
+    result_1 = func(1, 2)
+    result_2 = func(second=3, first=2)
+
+    assert result_1 == 3
+    assert result_2 == 5
+
+
+def test_mock_function_call_returns_value_from_table_configured_with_rows():
+    func = mock(function_with_default)
+    every(func).with_table(((param, 0), param * 2) for param in range(3))
+
+    result = func(2)
+
+    assert result == 4
+
+
+def test_mock_function_call_returns_value_from_table_with_single_values_as_keys():
+    func = mock(function)
+    every(func).with_table({1: 2, 2: 4})
+
+    result = func(2)
+
+    assert result == 4
+
+
+def test_mock_function_call_raises_exception_when_called_with_arguments_not_present_in_table():
+    func = mock(function)
+    every(func).with_table({1: 2})
+
+    with pytest.raises(CallNotConfiguredException):
+        func(2)
+
+
+def test_mock_function_call_returns_value_of_first_matching_configuration_when_table_is_configured():
+    func = mock(function)
+    every(func).with_args(1).returns(1)
+    every(func).with_table({1: 2, 2: 2, 3: 2})
+    every(func).with_args(2).returns(3)
+    every(func).with_args(gt(0)).returns(4)
+
+    result_1 = func(1)
+    result_2 = func(2)
+    result_3 = func(4)
+
+    assert result_1 == 1
+    assert result_2 == 2
+    assert result_3 == 4
+
+
+def test_mock_configuration_raises_exception_when_table_does_not_match_signature():
+    func = mock(function)
+
+    with pytest.raises(NotMatchingSignatureException):
+        every(func).with_table({(1, 2): 3})
+
+
+def test_mock_configuration_raises_exception_when_table_is_configured_with_args():
+    func = mock(function)
+
+    with pytest.raises(ValueError):
+        every(func).with_args(1).with_table({1: 2})
+
+
 def test_mock_configuration_raises_exception_when_args_does_not_match_signature():
     func = mock(function)
 
@@ -200,8 +414,134 @@ def test_mock_property_returns_configured_value():
     assert result == 1
 
 
+def test_mock_property_returns_configured_values_many():
+    obj = mock(A)
+    every(prop(obj).prop).returns_many([1, 2])
+
+    result_1 = obj.prop
+    result_2 = obj.prop
+
+    assert result_1 == 1
+    assert result_2 == 2
+
+
+def test_mock_method_returns_the_same_mock_callable_on_each_access():
+    obj = mock(A)
+
+    method = obj.method
+
+    assert obj.method is method
+    assert obj.mock_attr_callable["method"] is method
+
+
+def test_mocks_of_the_same_class_share_generated_mock_class():
+    obj_1 = mock(A)
+    obj_2 = mock(A)
+
+    assert type(obj_1) is type(obj_2)
+    assert isinstance(obj_1, Mock)
+    assert type(mock(function)) is Mock
+
+
+def test_mocks_of_the_same_class_share_method_targets():
+    obj_1 = mock(A)
+    obj_2 = mock(A)
+
+    assert obj_1.method.target is obj_2.method.target
+
+
 def test_prop_should_raise_attribute_error_when_called_with_wrong_attr():
     obj = mock(A)
 
     with pytest.raises(AttributeError):
         prop(obj).wrong_property
+
+
+def test_mock_async_method_call_returns_awaitable_with_configured_value():
+    obj = mock(A)
+    every(obj.async_method).with_args(1).returns(2)
+
+    result = run(obj.async_method(1))
+
+    assert result == 2
+
+
+def test_mock_async_function_call_raises_configured_exception_when_awaited():
+    func = mock(async_function)
+    every(func).raises(Error())
+    awaitable = func(1)
+
+    with pytest.raises(Error):
+        run(awaitable)
+
+
+def test_mock_async_function_call_raises_configured_cancelled_error_when_awaited():
+    func = mock(async_function)
+    every(func).raises(asyncio.CancelledError())
+    awaitable = func(1)
+
+    with pytest.raises(asyncio.CancelledError):
+        run(awaitable)
+
+
+def test_mock_async_function_call_with_timeline_raises_configured_cancelled_error_when_awaited():
+    func = mock(async_function, recording=Recording.full().with_timeline())
+    every(func).raises(asyncio.CancelledError())
+    awaitable = func(1)
+
+    with pytest.raises(asyncio.CancelledError):
+        run(awaitable)
+
+
+def test_mock_async_function_call_returns_many_values():
+    func = mock(async_function)
+    every(func).returns_many([1, 2])
+
+    async def call():
+        return [await func(1), await func(1), await func(1)]
+
+    result = run(call())
+
+    assert result == [1, 2, 2]
+
+
+def test_mock_async_function_call_awaits_result_of_provided_async_callable():
+    async def result_function():
+        await asyncio.sleep(0)
+        return 1
+
+    func = mock(async_function)
+    every(func).execute(result_function)
+
+    result = run(func(1))
+
+    assert result == 1
+
+
+def test_mock_async_function_call_returns_value_of_provided_sync_callable():
+    func = mock(async_function)
+    every(func).execute(lambda: 1)
+
+    result = run(func(1))
+
+    assert result == 1
+
+
+def test_mock_async_function_call_can_be_scheduled_as_task():
+    func = mock(async_function)
+    every(func).returns(1)
+
+    async def call():
+        return await asyncio.gather(asyncio.ensure_future(func(1)), func(1))
+
+    result = run(call())
+
+    assert result == [1, 1]
+
+
+def test_mock_async_function_call_raises_exception_when_call_is_not_configured_and_awaited():
+    func = mock(async_function)
+    awaitable = func(1)
+
+    with pytest.raises(CallNotConfiguredException):
+        run(awaitable)
@@ -0,0 +1,178 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from mimid import mock, every, freeze
+from mimid.effects import LatencyEffect, ErrorEffect, RateLimitEffect, ConcurrencyLimitEffect
+from tests.targets import A, Error, function, async_function
+from tests.utils import run
+
+
+def collect_errors(func, calls: int) -> list:
+    results = []
+    for _ in range(calls):
+        try:
+            results.append(func(1))
+        except Error:
+            results.append(None)
+    return results
+
+
+def test_latency_effect_returns_fixed_latency():
+    effect = LatencyEffect(0.5)
+
+    latency = effect.enter(rng=None)
+
+    assert latency == 0.5
+
+
+def test_latency_effect_returns_latency_sampled_from_distribution():
+    effect = LatencyEffect(lambda rng: rng.uniform(1, 2))
+
+    latency = effect.enter(random.Random(0))
+
+    assert 1 <= latency <= 2
+
+
+def test_error_effect_raises_exception_with_given_probability():
+    effect = ErrorEffect(Error(), probability=1)
+
+    with pytest.raises(Error):
+        effect.enter(random.Random(0))
+
+
+def test_rate_limit_effect_raises_exception_when_burst_is_exceeded():
+    effect = RateLimitEffect(rate=0.001, exception=Error(), burst=2)
+    effect.enter(rng=None)
+    effect.enter(rng=None)
+
+    with pytest.raises(Error):
+        effect.enter(rng=None)
+
+
+def test_concurrency_limit_effect_raises_exception_when_limit_is_exceeded_until_exit():
+    effect = ConcurrencyLimitEffect(limit=1, exception=Error())
+    effect.enter(rng=None)
+
+    with pytest.raises(Error):
+        effect.enter(rng=None)
+    effect.exit()
+    effect.enter(rng=None)
+
+
+def test_mock_function_call_is_delayed_by_configured_latency():
+    func = mock(function)
+    every(func).with_latency(0.05).returns(1)
+    start = time.monotonic()
+
+    result = func(1)
+
+    assert result == 1
+    assert time.monotonic() - start >= 0.05
+
+
+def test_mock_function_call_is_delayed_only_for_matching_arguments():
+    func = mock(function)
+    every(func).with_args(1).with_latency(10).returns(1)
+    every(func).with_args(2).returns(2)
+
+    result = func(2)
+
+    assert result == 2
+
+
+def test_mock_function_call_raises_errors_reproducibly_with_the_same_seed():
+    first = mock(function)
+    every(first).with_seed(1).with_errors(Error(), probability=0.5).returns(1)
+    second = mock(function)
+    every(second).with_seed(1).with_errors(Error(), probability=0.5).returns(1)
+
+    first_results = collect_errors(first, 100)
+    second_results = collect_errors(second, 100)
+
+    assert first_results == second_results
+    assert 0 < first_results.count(None) < 100
+
+
+def test_mock_function_call_raises_exception_when_rate_limit_is_exceeded():
+    func = mock(function)
+    every(func).with_rate_limit(0.001, Error(), burst=3).returns(1)
+
+    results = collect_errors(func, 5)
+
+    assert results == [1, 1, 1, None, None]
+
+
+def test_mock_function_call_raises_exception_when_concurrency_limit_is_exceeded():
+    results = []
+    func = mock(function)
+    every(func).with_concurrency_limit(1, Error()).with_latency(0.1).returns(1)
+    thread = threading.Thread(target=lambda: results.append(func(1)))
+    thread.start()
+    time.sleep(0.02)
+
+    with pytest.raises(Error):
+        func(1)
+    thread.join()
+    assert results == [1]
+    assert func(1) == 1
+
+
+def test_mock_async_function_call_awaits_configured_latency_without_blocking_loop():
+    func = mock(async_function)
+    every(func).with_latency(0.05).returns(1)
+
+    async def call():
+        start = time.monotonic()
+        results = await asyncio.gather(*(func(1) for _ in range(10)))
+        return results, time.monotonic() - start
+
+    results, duration = run(call())
+
+    assert results == [1] * 10
+    assert 0.05 <= duration < 0.5
+
+
+def test_mock_async_function_call_raises_exception_when_concurrency_limit_is_exceeded():
+    func = mock(async_function)
+    every(func).with_concurrency_limit(2, Error()).with_latency(0.01).returns(1)
+
+    async def call():
+        return await asyncio.gather(*(func(1) for _ in range(3)), return_exceptions=True)
+
+    results = run(call())
+
+    assert results[:2] == [1, 1]
+    assert isinstance(results[2], Error)
+
+
+def test_template_creates_mocks_with_separate_effects_state():
+    obj = mock(A)
+    every(obj.method).with_rate_limit(0.001, Error(), burst=1).returns(1)
+    template = freeze(obj)
+    first = template.create()
+    second = template.create()
+
+    first.method(1)
+
+    assert second.method(1) == 1
+
+
+def test_mock_function_call_raises_error_effect_exception_when_table_is_configured():
+    func = mock(function)
+    every(func).with_errors(Error(), probability=1.0).with_table({1: 2})
+
+    with pytest.raises(Error):
+        func(1)
+
+
+def test_mock_function_call_raises_error_effect_exception_when_table_is_configured_in_template():
+    func = mock(function)
+    every(func).with_errors(Error(), probability=1.0).with_table({1: 2})
+    template = freeze(func)
+
+    with pytest.raises(Error):
+        template.create()(1)
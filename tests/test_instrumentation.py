@@ -0,0 +1,136 @@
+import gc
+import weakref
+
+import pytest
+
+from mimid import mock, every, verify, freeze, reset, gt, instrumentation, CallNotConfiguredException
+from tests.targets import A, function
+
+
+@pytest.fixture
+def enabled_instrumentation():
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.clear()
+
+
+def test_mock_is_not_instrumented_by_default():
+    func = mock(function)
+
+    assert func.mock_callable.stats is None
+
+
+def test_instrumented_mock_counts_calls_hits_and_misses(enabled_instrumentation):
+    func = mock(function)
+    every(func).with_args(1).returns(1)
+
+    func(1)
+    with pytest.raises(CallNotConfiguredException):
+        func(2)
+
+    stats = func.mock_callable.stats
+    assert stats.calls == 2
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.bind_ns > 0
+    assert stats.dispatch_ns > 0
+
+
+def test_instrumented_mock_counts_matcher_evaluations(enabled_instrumentation):
+    func = mock(function)
+    every(func).with_args(gt(0)).returns(1)
+
+    func(1)
+    func(2)
+
+    assert func.mock_callable.stats.evaluations == 2
+
+
+def test_instrumented_mock_counts_verifications(enabled_instrumentation):
+    func = mock(function)
+    every(func).returns(1)
+    func(1)
+
+    verify(func).with_args(1).called(times=1)
+
+    assert func.mock_callable.stats.verifications == 1
+    assert func.mock_callable.stats.verify_ns > 0
+
+
+def test_report_sums_stats_of_mocks_of_the_same_target_and_sorts_them_by_cost(enabled_instrumentation):
+    first = mock(A)
+    every(first.method).returns(1)
+    second = mock(A)
+    every(second.method).returns(1)
+    func = mock(function)
+    every(func).returns(1)
+
+    for _ in range(100):
+        first.method(1)
+        second.method(1)
+    func(1)
+
+    collected = instrumentation.collect()
+    assert [stats.name for stats in collected] == ["A.method", "function"]
+    assert collected[0].calls == 200
+
+
+def test_report_lists_never_hit_configurations(enabled_instrumentation):
+    func = mock(function)
+    every(func).with_args(1).returns(1)
+    every(func).with_args(2).returns(2)
+
+    func(1)
+
+    report = instrumentation.report()
+    assert "function: configuration #1" in report
+    assert "function: configuration #0" not in report
+
+
+def test_report_does_not_list_configuration_hit_by_mock_created_from_template(enabled_instrumentation):
+    func = mock(function)
+    every(func).with_args(1).returns(1)
+    template = freeze(func)
+
+    template.create()(1)
+
+    assert "never hit" not in instrumentation.report()
+
+
+def test_template_creates_stats_only_for_its_mocks(enabled_instrumentation):
+    func = mock(function)
+    template = freeze(func)
+
+    template.create()
+
+    assert len(instrumentation.instrumentation.stats) == 3
+
+
+def test_stats_do_not_keep_configured_values_alive(enabled_instrumentation):
+    class Value:
+        pass
+
+    value = Value()
+    reference = weakref.ref(value)
+    func = mock(function)
+    every(func).with_args(gt(0)).returns(value)
+    func(1)
+
+    del func, value
+    gc.collect()
+
+    assert reference() is None
+    assert instrumentation.collect()[0].configurations[0].hits == 1
+
+
+def test_report_does_not_list_configurations_removed_by_reset(enabled_instrumentation):
+    func = mock(function)
+    every(func).with_args(1).returns(1)
+    every(func).with_args(2).returns(2)
+    reset(func, configurations=True)
+    every(func).with_args(1).returns(1)
+
+    func(1)
+
+    assert "never hit" not in instrumentation.report()
@@ -0,0 +1,45 @@
+import pytest
+
+from mimid import MockPool, every, verify, CallNotConfiguredException
+from tests.targets import A, function
+
+
+def test_pool_acquire_creates_mock_when_pool_is_empty():
+    pool = MockPool()
+
+    obj = pool.acquire(A)
+    every(obj.method).returns(1)
+
+    assert obj.method(1) == 1
+
+
+def test_pool_acquire_returns_released_mock_reset():
+    pool = MockPool()
+    obj = pool.acquire(A)
+    every(obj.method).returns(1)
+    obj.method(1)
+    pool.release(obj)
+
+    reused_obj = pool.acquire(A)
+
+    assert reused_obj is obj
+    verify(reused_obj.method).called(times=0)
+    with pytest.raises(CallNotConfiguredException):
+        reused_obj.method(1)
+
+
+def test_pool_keeps_mocks_per_target():
+    pool = MockPool()
+    func = pool.acquire(function)
+    pool.release(func)
+
+    obj = pool.acquire(A)
+
+    assert obj is not func
+
+
+def test_pool_release_raises_exception_when_called_with_non_mock_object():
+    pool = MockPool()
+
+    with pytest.raises(TypeError):
+        pool.release(1)
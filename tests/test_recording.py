@@ -0,0 +1,378 @@
+import threading
+
+import pytest
+
+from mimid import CallsNotRecordedException
+from mimid.common import CallArguments
+from mimid.matchers.call import SpecificCallArgumentsMatcher
+from mimid.matchers.value import ValueMatcher, gt, lt, gte
+from mimid.recording import (
+    CallLog,
+    FullCallLog,
+    BoundedCallLog,
+    CountingCallLog,
+    DisabledCallLog,
+    InternedCallLog,
+    FileCallLog,
+    ColumnarCallLog,
+    ThreadSafeCallLog,
+    MAX_BUFFERED_CALLS,
+)
+
+
+def func_with_one_param(param):
+    pass
+
+
+def create_call_arguments(*args, **kwargs) -> CallArguments:
+    return CallArguments(args=args, kwargs=kwargs)
+
+
+class RecordingValueMatcher(ValueMatcher):
+    def __init__(self, function) -> None:
+        self.function = function
+
+    def __call__(self, value) -> bool:
+        return self.function(value)
+
+
+def append_call(call_log: CallLog, *args, **kwargs) -> None:
+    call_arguments = create_call_arguments(*args, **kwargs)
+    call_log.append(call_arguments, call_arguments.bind(func_with_one_param))
+
+
+def test_full_call_log_keeps_all_calls():
+    call_log = FullCallLog()
+    calls_arguments = [create_call_arguments(1), create_call_arguments(2)]
+
+    for call_arguments in calls_arguments:
+        call_log.append(call_arguments, call_arguments.bind(func_with_one_param))
+
+    assert call_log.count() == 2
+    assert list(call_log) == calls_arguments
+
+
+def test_full_call_log_counts_matching_calls():
+    call_log = FullCallLog()
+    append_call(call_log, 1)
+    append_call(call_log, 2)
+    append_call(call_log, param=1)
+    matcher = SpecificCallArgumentsMatcher(target=func_with_one_param, arguments=create_call_arguments(1))
+
+    assert call_log.count_matching(matcher) == 2
+
+
+def test_bounded_call_log_keeps_last_calls():
+    call_log = BoundedCallLog(max_calls=2)
+    calls_arguments = [create_call_arguments(1), create_call_arguments(2)]
+
+    for call_arguments in calls_arguments:
+        call_log.append(call_arguments, call_arguments.bind(func_with_one_param))
+
+    assert call_log.count() == 2
+    assert list(call_log) == calls_arguments
+
+
+def test_bounded_call_log_counts_all_calls_but_raises_exception_when_iterated_after_dropping_calls():
+    call_log = BoundedCallLog(max_calls=2)
+
+    for param in range(3):
+        append_call(call_log, param)
+
+    assert call_log.count() == 3
+    assert len(call_log.calls_arguments) == 2
+    with pytest.raises(CallsNotRecordedException):
+        list(call_log)
+
+
+def test_counting_call_log_counts_calls_without_keeping_them():
+    call_log = CountingCallLog()
+
+    append_call(call_log, 1)
+
+    assert call_log.count() == 1
+    with pytest.raises(CallsNotRecordedException):
+        list(call_log)
+
+
+def test_disabled_call_log_does_not_record_anything():
+    call_log = DisabledCallLog()
+
+    append_call(call_log, 1)
+
+    with pytest.raises(CallsNotRecordedException):
+        call_log.count()
+    with pytest.raises(CallsNotRecordedException):
+        list(call_log)
+
+
+def test_interned_call_log_keeps_equal_calls_once():
+    call_log = InternedCallLog()
+    calls_arguments = [create_call_arguments(1), create_call_arguments(2), create_call_arguments(param=1)]
+
+    for call_arguments in calls_arguments:
+        call_log.append(call_arguments, call_arguments.bind(func_with_one_param))
+
+    assert call_log.count() == 3
+    assert call_log.calls_counts == [2, 1]
+    assert list(call_log.calls) == [0, 1, 0]
+    assert list(call_log) == [calls_arguments[0], calls_arguments[1], calls_arguments[0]]
+
+
+def test_interned_call_log_keeps_unhashable_calls_separately():
+    call_log = InternedCallLog()
+
+    append_call(call_log, [1])
+    append_call(call_log, [1])
+
+    assert call_log.count() == 2
+    assert call_log.calls_counts == [1, 1]
+
+
+def test_interned_call_log_keeps_equal_calls_with_arguments_of_different_types_separately():
+    call_log = InternedCallLog()
+
+    for param in [1, True, 1.0, 1]:
+        append_call(call_log, param)
+
+    assert call_log.calls_counts == [2, 1, 1]
+    assert [call_arguments.args for call_arguments in call_log] == [(1,), (True,), (1.0,), (1,)]
+    assert [type(call_arguments.args[0]) for call_arguments in call_log] == [int, bool, float, int]
+
+
+def test_interned_call_log_counts_matching_calls_evaluating_matcher_once_per_distinct_call():
+    evaluated = []
+
+    def record(value):
+        evaluated.append(value)
+        return value == 1
+
+    call_log = InternedCallLog()
+    for param in [1, 2, 1, 1, 2]:
+        append_call(call_log, param)
+    matcher = SpecificCallArgumentsMatcher(
+        target=func_with_one_param, arguments=create_call_arguments(RecordingValueMatcher(record))
+    )
+
+    assert call_log.count_matching(matcher) == 3
+    assert evaluated == [1, 2]
+
+
+def test_file_call_log_keeps_all_calls():
+    call_log = FileCallLog(initial_size=16)
+
+    for param in range(100):
+        append_call(call_log, param=param)
+
+    assert call_log.count() == 100
+    assert [(call_arguments.args, call_arguments.kwargs) for call_arguments in call_log] == [
+        ((), {"param": param}) for param in range(100)
+    ]
+
+
+def test_file_call_log_counts_matching_calls():
+    call_log = FileCallLog()
+    append_call(call_log, 1)
+    append_call(call_log, 2)
+    append_call(call_log, param=1)
+    matcher = SpecificCallArgumentsMatcher(target=func_with_one_param, arguments=create_call_arguments(1))
+
+    assert call_log.count_matching(matcher) == 2
+
+
+def test_file_call_log_keeps_arguments_which_can_not_be_pickled():
+    call_log = FileCallLog()
+    function = lambda: None
+    lock = threading.Lock()
+
+    append_call(call_log, function)
+    append_call(call_log, [lock])
+
+    assert [call_arguments.args for call_arguments in call_log] == [(function,), ([lock],)]
+
+
+def test_file_call_log_keeps_arguments_which_can_not_be_pickled_and_are_compared_by_value():
+    class NotPicklable:
+        def __eq__(self, other):
+            return isinstance(other, NotPicklable)
+
+        def __reduce__(self):
+            raise TypeError("can not be pickled")
+
+    call_log = FileCallLog()
+    value = NotPicklable()
+
+    append_call(call_log, value)
+
+    assert list(call_log)[0].args[0] is value
+
+
+def test_file_call_log_keeps_arguments_compared_by_identity():
+    call_log = FileCallLog()
+    obj = object()
+    append_call(call_log, (obj, b"abc"))
+
+    (call_arguments,) = list(call_log)
+
+    assert call_arguments.args[0][0] is obj
+    assert call_arguments.args[0][1] == b"abc"
+
+
+def test_file_call_log_clears_kept_arguments():
+    call_log = FileCallLog()
+    append_call(call_log, object())
+
+    call_log.clear()
+
+    assert call_log.references == []
+
+
+def test_file_call_log_closes_file():
+    call_log = FileCallLog()
+
+    call_log.close()
+
+    assert call_log.file.closed
+    assert call_log.buffer.closed
+
+
+def func_with_two_params(first, second=None):
+    pass
+
+
+def append_columns_call(call_log: CallLog, *args, **kwargs) -> None:
+    call_arguments = create_call_arguments(*args, **kwargs)
+    call_log.append(call_arguments, call_arguments.bind(func_with_two_params))
+
+
+def create_columns_matcher(*args, **kwargs) -> SpecificCallArgumentsMatcher:
+    return SpecificCallArgumentsMatcher(target=func_with_two_params, arguments=create_call_arguments(*args, **kwargs))
+
+
+def test_columnar_call_log_stores_numbers_in_typed_arrays():
+    call_log = ColumnarCallLog()
+
+    append_columns_call(call_log, 1, 0.5)
+    append_columns_call(call_log, 2, second=1.5)
+
+    assert [column.typecode for column in call_log.columns] == ["q", "d"]
+    assert [call_arguments.bind(func_with_two_params) for call_arguments in call_log] == [(1, 0.5), (2, 1.5)]
+
+
+def test_columnar_call_log_stores_other_values_in_lists_keeping_their_types():
+    call_log = ColumnarCallLog()
+
+    append_columns_call(call_log, 1, 2)
+    append_columns_call(call_log, 1.5, 2**70)
+    append_columns_call(call_log, "a", True)
+
+    assert call_log.columns == [[1, 1.5, "a"], [2, 2**70, True]]
+    assert [type(value) for value in call_log.columns[1]] == [int, int, bool]
+
+
+def test_columnar_call_log_counts_matching_calls_with_numpy_masks():
+    pytest.importorskip("numpy")
+    call_log = ColumnarCallLog()
+    for value in range(100):
+        append_columns_call(call_log, value, value / 2)
+    matcher = create_columns_matcher(gt(10) & lt(20), ~gte(8))
+
+    assert call_log._get_mask(matcher) is not None
+    assert call_log.count_matching(matcher) == 5
+
+
+def test_columnar_call_log_counts_matching_calls_with_matchers_when_values_are_not_numbers():
+    call_log = ColumnarCallLog()
+    append_columns_call(call_log, "a")
+    append_columns_call(call_log, "b")
+    matcher = create_columns_matcher("a")
+
+    assert call_log._get_mask(matcher) is None
+    assert call_log.count_matching(matcher) == 1
+
+
+def test_columnar_call_log_clears_calls():
+    call_log = ColumnarCallLog()
+    append_columns_call(call_log, 1)
+
+    call_log.clear()
+    append_columns_call(call_log, "a")
+
+    assert call_log.count() == 1
+    assert list(call_log)[0].bind(func_with_two_params) == ("a", None)
+
+
+def run_in_threads(function, threads_count: int) -> None:
+    threads = [threading.Thread(target=function) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_thread_safe_call_log_keeps_calls_from_all_threads():
+    call_log = ThreadSafeCallLog(FullCallLog())
+
+    run_in_threads(lambda: [append_call(call_log, 1) for _ in range(100)], threads_count=8)
+
+    assert call_log.count() == 800
+    assert len(list(call_log)) == 800
+
+
+def test_thread_safe_call_log_counts_matching_calls_with_wrapped_call_log():
+    call_log = ThreadSafeCallLog(InternedCallLog())
+    append_call(call_log, 1)
+    append_call(call_log, 2)
+    append_call(call_log, 1)
+
+    matches = call_log.count_matching(
+        SpecificCallArgumentsMatcher(target=func_with_one_param, arguments=create_call_arguments(1))
+    )
+
+    assert matches == 2
+
+
+def test_thread_safe_call_log_clears_not_merged_calls():
+    call_log = ThreadSafeCallLog(FullCallLog())
+    append_call(call_log, 1)
+
+    call_log.clear()
+
+    assert call_log.count() == 0
+
+
+@pytest.mark.parametrize("call_log", [CountingCallLog(), DisabledCallLog()])
+def test_thread_safe_call_log_does_not_buffer_calls_when_wrapped_call_log_does_not_store_arguments(call_log):
+    thread_safe_call_log = ThreadSafeCallLog(call_log)
+
+    run_in_threads(lambda: [append_call(thread_safe_call_log, 1) for _ in range(100)], threads_count=4)
+
+    assert thread_safe_call_log.buffers == []
+
+
+def test_thread_safe_call_log_counts_calls_when_wrapped_call_log_counts_calls():
+    call_log = ThreadSafeCallLog(CountingCallLog())
+
+    run_in_threads(lambda: [append_call(call_log, 1) for _ in range(100)], threads_count=8)
+
+    assert call_log.count() == 800
+
+
+def test_thread_safe_call_log_merges_buffered_calls_when_buffer_is_full():
+    call_log = ThreadSafeCallLog(BoundedCallLog(max_calls=10))
+
+    for _ in range(MAX_BUFFERED_CALLS * 3):
+        append_call(call_log, 1)
+
+    assert sum(len(buffer) for _, buffer in call_log.buffers) < MAX_BUFFERED_CALLS
+    assert len(call_log.call_log.calls_arguments) == 10
+
+
+def test_thread_safe_call_log_drops_buffers_of_finished_threads():
+    call_log = ThreadSafeCallLog(FullCallLog())
+    append_call(call_log, 1)
+
+    run_in_threads(lambda: append_call(call_log, 2), threads_count=8)
+
+    assert call_log.count() == 9
+    assert len(call_log.buffers) == 1
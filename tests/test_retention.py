@@ -0,0 +1,134 @@
+import gc
+
+import pytest
+
+from mimid import mock, every, verify, Recording, Retention, digest_eq, any, eq, one_of
+from mimid import digest
+from mimid.digest import Fingerprint
+from mimid.retention import DEAD_REFERENCE
+from tests.targets import function
+
+
+class Payload:
+    pass
+
+
+def test_weak_retention_does_not_keep_arguments_alive():
+    func = mock(function, recording=Recording.full().with_retention(Retention.weak()))
+    every(func).returns(1)
+    payload = Payload()
+    func(payload)
+    func(1)
+
+    del payload
+    gc.collect()
+
+    assert [call_arguments.args for call_arguments in func.mock_callable.calls_arguments] == [(DEAD_REFERENCE,), (1,)]
+
+
+def test_weak_retention_does_not_keep_arguments_alive_when_mock_is_thread_safe():
+    func = mock(function, recording=Recording.full().with_retention(Retention.weak()), thread_safe=True)
+    every(func).returns(1)
+    payload = Payload()
+    func(payload)
+
+    del payload
+    gc.collect()
+
+    assert [call_arguments.args for call_arguments in func.mock_callable.calls_arguments] == [(DEAD_REFERENCE,)]
+
+
+def test_weak_retention_restores_alive_arguments():
+    func = mock(function, recording=Recording.full().with_retention(Retention.weak()))
+    every(func).returns(1)
+    payload = Payload()
+
+    func(param=payload)
+
+    verify(func).with_args(payload).called(times=1)
+
+
+def test_fingerprint_retention_stores_fingerprints_of_large_buffers():
+    func = mock(function, recording=Recording.full().with_retention(Retention.fingerprints(min_size=10)))
+    every(func).returns(1)
+
+    func(b"x" * 10)
+    func(b"x" * 9)
+
+    args = [call_arguments.args[0] for call_arguments in func.mock_callable.calls_arguments]
+    assert isinstance(args[0], Fingerprint)
+    assert args[1] == b"x" * 9
+
+
+def test_fingerprint_retention_allows_verification_with_eq_and_digest_eq():
+    func = mock(function, recording=Recording.interned().with_retention(Retention.fingerprints(min_size=10)))
+    every(func).returns(1)
+
+    func(b"x" * 100)
+    func(bytearray(b"x" * 100))
+    func(b"y" * 100)
+
+    verify(func).with_args(b"x" * 100).called(times=2)
+    verify(func).with_args(digest_eq(b"y" * 100)).called(times=1)
+    verify(func).with_args(any()).called(times=3)
+
+
+def test_fingerprint_equals_buffer_with_the_same_content():
+    fingerprint = Fingerprint.create(b"abc")
+
+    assert fingerprint == b"abc"
+    assert fingerprint == memoryview(b"abc")
+    assert fingerprint == Fingerprint.create(bytearray(b"abc"))
+    assert fingerprint != b"abd"
+    assert fingerprint != "abc"
+    assert hash(fingerprint) == hash(Fingerprint.create(b"abc"))
+
+
+def test_fingerprint_retention_allows_verification_with_collapsed_eq_matchers_and_one_of():
+    func = mock(function, recording=Recording.full().with_retention(Retention.fingerprints(min_size=10)))
+    every(func).returns(1)
+    payload = b"x" * 100
+
+    func(payload)
+
+    verify(func).with_args(eq(payload) | eq(b"y")).called(times=1)
+    verify(func).with_args(one_of([payload])).called(times=1)
+    verify(func).with_args(one_of([b"y" * 100, [1]])).called(times=0)
+
+
+def test_fingerprint_retention_allows_verification_with_array():
+    numpy = pytest.importorskip("numpy")
+    func = mock(function, recording=Recording.full().with_retention(Retention.fingerprints(min_size=10)))
+    every(func).returns(1)
+
+    func(numpy.arange(100))
+
+    verify(func).with_args(numpy.arange(100)).called(times=1)
+    verify(func).with_args(numpy.arange(1, 101)).called(times=0)
+
+
+def test_fingerprint_retention_computes_digest_of_argument_once(monkeypatch):
+    computed = []
+    compute_digest = digest.compute_digest
+    monkeypatch.setattr(digest, "compute_digest", lambda value: computed.append(value) or compute_digest(value))
+    func = mock(function, recording=Recording.full().with_retention(Retention.fingerprints(min_size=10)))
+    every(func).returns(1)
+
+    func(b"x" * 100)
+
+    assert len(computed) == 1
+
+
+def test_fingerprint_retention_does_not_keep_buffers_passed_as_var_positional_arguments():
+    def function_with_var_args(*args):
+        pass
+
+    func = mock(function_with_var_args, recording=Recording.full().with_retention(Retention.fingerprints(min_size=10)))
+    every(func).returns(1)
+
+    func(b"x" * 100, 1)
+
+    (call_arguments,) = func.mock_callable.call_log.call_log
+    assert isinstance(call_arguments.args[0], Fingerprint)
+    assert isinstance(call_arguments.bind(function_with_var_args)[0][0], Fingerprint)
+    verify(func).with_args(b"x" * 100, 1).called(times=1)
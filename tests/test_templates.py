@@ -0,0 +1,125 @@
+import pytest
+
+from mimid import mock, every, verify, prop, freeze, WrongNumberOfCallsException
+from tests.targets import A, function
+from tests.utils import not_raises, run
+
+
+def test_template_creates_mock_with_configured_behaviour():
+    obj = mock(A)
+    every(obj.method).with_args(1).returns(2)
+    every(prop(obj).prop).returns(3)
+    template = freeze(obj)
+
+    clone = template.create()
+
+    assert clone.method(1) == 2
+    assert clone.prop == 3
+
+
+def test_template_creates_mock_with_configured_async_behaviour():
+    obj = mock(A)
+    every(obj.async_method).with_args(1).returns(2)
+    template = freeze(obj)
+
+    clone = template.create()
+
+    assert run(clone.async_method(1)) == 2
+
+
+def test_template_creates_mocks_with_separate_calls():
+    func = mock(function)
+    every(func).returns(1)
+    template = freeze(func)
+    clone_1 = template.create()
+    clone_2 = template.create()
+
+    clone_1(1)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(clone_1).called(times=1)
+        verify(clone_2).called(times=0)
+
+
+def test_template_creates_mocks_with_separate_returns_many_cursors():
+    func = mock(function)
+    every(func).returns_many([1, 2])
+    template = freeze(func)
+    clone_1 = template.create()
+    clone_2 = template.create()
+
+    results_1 = [clone_1(0), clone_1(0), clone_1(0)]
+    results_2 = [clone_2(0), clone_2(0)]
+
+    assert results_1 == [1, 2, 2]
+    assert results_2 == [1, 2]
+
+
+@pytest.mark.parametrize("calls_before_freeze", [1, 3])
+def test_template_creates_mocks_returning_many_values_from_the_beginning(calls_before_freeze):
+    func = mock(function)
+    every(func).returns_many([1, 2, 3])
+    for _ in range(calls_before_freeze):
+        func(0)
+    template = freeze(func)
+    clone = template.create()
+
+    results = [clone(0), clone(0), clone(0)]
+
+    assert results == [1, 2, 3]
+
+
+def test_template_creates_mocks_repeating_last_value_of_exhausted_one_shot_iterator():
+    func = mock(function)
+    every(func).returns_many(iter([1, 2]))
+    func(0)
+    func(0)
+    func(0)
+    clone = freeze(func).create()
+
+    results = [clone(0), clone(0)]
+
+    assert results == [2, 2]
+
+
+def test_template_creates_mocks_with_separate_cursors_for_one_shot_iterator():
+    func = mock(function)
+    every(func).returns_many(iter([1, 2, 3]))
+    template = freeze(func)
+    clone_1 = template.create()
+    clone_2 = template.create()
+
+    results_1 = [clone_1(0), clone_1(0)]
+    results_2 = [clone_2(0), clone_2(0), clone_2(0)]
+
+    assert results_1 == [1, 2]
+    assert results_2 == [1, 2, 3]
+
+
+def test_template_creates_mocks_sharing_configurations_without_state():
+    func = mock(function)
+    every(func).with_args(1).returns(2)
+    template = freeze(func)
+
+    clone = template.create()
+
+    assert clone.mock_callable.call_configurations[0] is func.mock_callable.call_configurations[0]
+
+
+def test_template_is_not_affected_by_clone_or_original_mock_configuration():
+    obj = mock(A)
+    every(obj.method).with_args(1).returns(2)
+    template = freeze(obj)
+    clone = template.create()
+
+    every(clone.method).with_args(2).returns(3)
+    every(obj.method).with_args(3).returns(4)
+
+    other_clone = template.create()
+    assert clone.method(2) == 3
+    assert len(other_clone.method.call_configurations) == 1
+
+
+def test_freeze_raises_exception_when_called_with_non_mock_object():
+    with pytest.raises(TypeError):
+        freeze(1)
@@ -0,0 +1,147 @@
+import pytest
+
+from mimid import mock, every, verify, timeline, reset, freeze, lte, Recording, CallsNotRecordedException
+from mimid import WrongNumberOfCallsException
+from mimid.timeline import Timeline, NANOSECONDS
+from tests.targets import A, function, async_function
+from tests.utils import not_raises, run
+
+
+def create_timeline(*calls) -> Timeline:
+    calls_timeline = Timeline()
+    for timestamp, duration in calls:
+        calls_timeline.append(int(timestamp * NANOSECONDS), int(duration * NANOSECONDS))
+    return calls_timeline
+
+
+def test_timeline_calculates_calls_per_second():
+    calls_timeline = create_timeline((0, 0), (0.5, 0), (1, 0))
+
+    calls_per_second = calls_timeline.calls_per_second()
+
+    assert calls_per_second == 2
+
+
+def test_timeline_calculates_max_calls_in_window():
+    calls_timeline = create_timeline((0, 0), (2, 0), (2.1, 0), (2.9, 0), (3.5, 0))
+
+    max_calls = calls_timeline.max_calls_in_window(1)
+
+    assert max_calls == 3
+
+
+def test_timeline_calculates_max_concurrency():
+    calls_timeline = create_timeline((0, 1), (0.5, 1), (0.7, 0.1), (2, 1))
+
+    max_concurrency = calls_timeline.max_concurrency()
+
+    assert max_concurrency == 3
+
+
+def test_timeline_calculates_duration_percentiles():
+    calls_timeline = create_timeline((0, 1), (1, 2), (2, 3), (3, 4), (4, 5))
+
+    assert calls_timeline.duration_percentile(50) == 3
+    assert calls_timeline.duration_percentile(100) == 5
+    assert calls_timeline.duration_percentile(25) == 2
+
+
+def test_timeline_calculates_inter_arrival_percentiles_of_calls_appended_out_of_order():
+    calls_timeline = create_timeline((3, 0), (0, 0), (1, 0))
+
+    assert calls_timeline.inter_arrival_percentile(0) == 1
+    assert calls_timeline.inter_arrival_percentile(100) == 2
+
+
+def test_timeline_raises_exception_when_percentile_of_empty_timeline_is_calculated():
+    calls_timeline = Timeline()
+
+    with pytest.raises(ValueError):
+        calls_timeline.duration_percentile(50)
+
+
+def test_mock_method_call_is_recorded_in_timeline():
+    obj = mock(A, recording=Recording.full().with_timeline())
+    every(obj.method).with_latency(0.01).returns(1)
+
+    obj.method(1)
+    obj.method(1)
+
+    assert timeline(obj.method).count() == 2
+    assert timeline(obj.method).duration_percentile(0) >= 0.01
+
+
+def test_mock_method_call_which_raises_exception_is_recorded_in_timeline():
+    obj = mock(A, recording=Recording.full().with_timeline())
+
+    with pytest.raises(Exception):
+        obj.method(1)
+
+    assert timeline(obj.method).count() == 1
+
+
+def test_mock_async_function_call_is_recorded_in_timeline_when_awaited():
+    func = mock(async_function, recording=Recording.full().with_timeline())
+    every(func).with_latency(0.01).returns(1)
+
+    result = run(func(1))
+
+    assert result == 1
+    assert timeline(func).count() == 1
+    assert timeline(func).duration_percentile(0) >= 0.01
+
+
+def test_timeline_raises_exception_when_timeline_is_disabled():
+    func = mock(function)
+
+    with pytest.raises(CallsNotRecordedException):
+        timeline(func)
+
+
+def test_reset_clears_timeline():
+    func = mock(function, recording=Recording.full().with_timeline())
+    every(func).returns(1)
+    func(1)
+
+    reset(func)
+
+    assert timeline(func).count() == 0
+
+
+def test_template_creates_mocks_with_separate_timelines():
+    func = mock(function, recording=Recording.full().with_timeline())
+    every(func).returns(1)
+    template = freeze(func)
+    clone = template.create()
+
+    clone(1)
+
+    assert timeline(clone).count() == 1
+    assert timeline(template.create()).count() == 0
+
+
+def test_mock_function_verify_called_at_rate_does_not_raise_exception_when_calls_do_not_exceed_rate():
+    func = mock(function, recording=Recording.full().with_timeline())
+    every(func).returns(1)
+    func(1)
+    func(1)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(func).called_at_rate(lte(2))
+
+
+def test_mock_function_verify_called_at_rate_raises_exception_when_calls_exceed_rate():
+    func = mock(function, recording=Recording.full().with_timeline())
+    every(func).returns(1)
+    func(1)
+    func(1)
+
+    with pytest.raises(WrongNumberOfCallsException):
+        verify(func).called_at_rate(lte(1))
+
+
+def test_mock_function_verify_called_at_rate_raises_exception_when_timeline_is_disabled():
+    func = mock(function)
+
+    with pytest.raises(CallsNotRecordedException):
+        verify(func).called_at_rate(lte(1))
@@ -1,8 +1,27 @@
+import asyncio
+import threading
+import time
+
 import pytest
 
-from mimid import mock, every, WrongNumberOfCallsException, verify, gt, NotMatchingSignatureException
-from tests.targets import A, function
-from tests.utils import not_raises
+from mimid import (
+    mock,
+    every,
+    WrongNumberOfCallsException,
+    verify,
+    gt,
+    lt,
+    NotMatchingSignatureException,
+    Recording,
+    CallsNotRecordedException,
+    reset,
+    prop,
+    CallNotConfiguredException,
+    one_of,
+    in_ranges,
+)
+from tests.targets import A, function, function_with_default
+from tests.utils import not_raises, run
 
 
 def test_mock_method_verify_raises_exception_when_method_not_called():
@@ -148,3 +167,270 @@ def test_mock_function_verify_raises_exception_when_args_does_not_match_signatur
 
     with pytest.raises(NotMatchingSignatureException):
         verify(func).with_args(other_param=1)
+
+
+@pytest.mark.parametrize(
+    "recording",
+    [Recording.full(), Recording.last(2), Recording.interned(), Recording.counts(), Recording.full().thread_safe()],
+)
+def test_mock_method_verify_does_not_raise_exception_when_method_called_and_calls_are_counted(recording):
+    obj = mock(A, recording=recording)
+    every(obj.method).returns(2)
+
+    obj.method(1)
+    obj.method(1)
+    obj.method(1)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).called(times=3)
+
+
+def test_mock_method_verify_does_not_raise_exception_when_method_called_with_matching_arguments_and_recent_calls_recorded():
+    obj = mock(A, recording=Recording.last(2))
+    every(obj.method).returns(2)
+
+    obj.method(1)
+    obj.method(2)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).with_args(1).called(times=1)
+
+
+def test_mock_method_verify_does_not_raise_exception_when_method_called_with_matching_arguments_and_calls_interned():
+    obj = mock(A, recording=Recording.interned())
+    every(obj.method).returns(2)
+
+    obj.method(1)
+    obj.method(2)
+    obj.method(param=1)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).with_args(1).called(times=2)
+
+
+def test_mock_method_verify_does_not_raise_exception_when_method_called_with_matching_arguments_and_calls_in_file():
+    obj = mock(A, recording=Recording.file())
+    every(obj.method).returns(2)
+
+    obj.method(1)
+    obj.method(2)
+    obj.method(param=1)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).with_args(1).called(times=2)
+
+
+def test_mock_function_verify_does_not_raise_exception_when_function_called_with_object_and_calls_in_file():
+    func = mock(function, recording=Recording.file())
+    every(func).returns(2)
+    obj = object()
+
+    func(obj)
+    func(lambda: None)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(func).with_args(obj).called(times=1)
+
+
+def test_mock_function_verify_does_not_raise_exception_when_function_called_with_matching_arguments_and_calls_in_columns():
+    func = mock(function_with_default, recording=Recording.columnar())
+    every(func).returns(2)
+
+    for param in range(100):
+        func(param, other=param % 2)
+    func(1.5)
+    func("a")
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(func).with_args(gt(10) & lt(20), other=1).called(times=5)
+        verify(func).with_args(gt(97), other=1).called(times=1)
+        verify(func).with_args("a").called(times=1)
+
+
+@pytest.mark.parametrize("recording", [Recording.full(), Recording.columnar()])
+def test_mock_function_verify_does_not_raise_exception_when_verify_with_set_and_ranges_matchers(recording):
+    func = mock(function, recording=recording)
+    every(func).returns(2)
+
+    for param in range(100):
+        func(param)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(func).with_args(one_of(range(0, 100, 10))).called(times=10)
+        verify(func).with_args(in_ranges((0, 9), (90, 200))).called(times=one_of([20, 30]))
+        verify(func).called(times=in_ranges((0, 10), (100, 110)))
+
+
+def test_mock_method_verify_raises_exception_when_verify_with_args_and_calls_were_dropped():
+    obj = mock(A, recording=Recording.last(2))
+    every(obj.method).returns(2)
+
+    obj.method(1)
+    obj.method(2)
+    obj.method(3)
+
+    with pytest.raises(CallsNotRecordedException):
+        verify(obj.method).with_args(1).called()
+
+
+def test_mock_function_verify_raises_exception_when_verify_with_args_and_only_calls_count_is_recorded():
+    func = mock(function, recording=Recording.counts())
+    every(func).returns(2)
+
+    func(1)
+
+    with pytest.raises(CallsNotRecordedException):
+        verify(func).with_args(1).called()
+
+
+def test_mock_method_verify_does_not_raise_exception_when_thread_safe_mock_called_from_many_threads():
+    obj = mock(A, thread_safe=True)
+    every(obj.method).returns(2)
+
+    def call() -> None:
+        for param in range(100):
+            obj.method(param)
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).called(times=800)
+        verify(obj.method).with_args(gt(49)).called(times=400)
+
+
+def test_mock_function_verify_raises_exception_when_recording_is_disabled():
+    func = mock(function, recording=Recording.off())
+    every(func).returns(2)
+
+    result = func(1)
+
+    assert result == 2
+    with pytest.raises(CallsNotRecordedException):
+        verify(func).called()
+
+
+@pytest.mark.parametrize(
+    "recording",
+    [
+        Recording.full(),
+        Recording.last(2),
+        Recording.interned(),
+        Recording.file(),
+        Recording.columnar(),
+        Recording.counts(),
+    ],
+)
+def test_mock_method_verify_does_not_raise_exception_when_calls_were_reset(recording):
+    obj = mock(A, recording=recording)
+    every(obj.method).returns(2)
+    obj.method(1)
+
+    reset(obj)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).called(times=0)
+    assert obj.method(1) == 2
+
+
+def test_mock_method_call_raises_exception_when_configurations_were_reset():
+    obj = mock(A)
+    every(obj.method).with_args(1).returns(2)
+    every(prop(obj).prop).returns(3)
+    obj.method(1)
+
+    reset(obj, configurations=True)
+
+    with pytest.raises(CallNotConfiguredException):
+        obj.method(1)
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).called(times=1)
+
+
+def test_mock_function_verify_does_not_raise_exception_when_mock_callable_calls_were_reset():
+    obj = mock(A)
+    every(obj.method).returns(2)
+    obj.method(1)
+
+    reset(obj.method)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).called(times=0)
+
+
+def test_reset_raises_exception_when_called_with_non_mock_object():
+    with pytest.raises(TypeError):
+        reset(1)
+
+
+def call_later(function, *args) -> threading.Thread:
+    thread = threading.Timer(0.01, function, args=args)
+    thread.start()
+    return thread
+
+
+def test_mock_method_verify_called_within_does_not_raise_exception_when_method_called_from_other_thread():
+    obj = mock(A)
+    every(obj.method).returns(2)
+    call_later(obj.method, 1)
+
+    with not_raises(WrongNumberOfCallsException):
+        verify(obj.method).with_args(1).called_within(timeout=5)
+
+
+def test_mock_method_verify_called_within_returns_as_soon_as_method_called():
+    obj = mock(A)
+    every(obj.method).returns(2)
+    call_later(obj.method, 1)
+    start = time.monotonic()
+
+    verify(obj.method).called_within(timeout=5, times=1)
+
+    assert time.monotonic() - start < 1
+    assert obj.mock_callable.waiters == []
+
+
+def test_mock_method_verify_called_within_raises_exception_when_method_not_called_before_timeout():
+    obj = mock(A)
+    every(obj.method).returns(2)
+    call_later(obj.method, 2)
+
+    with pytest.raises(WrongNumberOfCallsException):
+        verify(obj.method).with_args(1).called_within(timeout=0.05)
+
+
+def test_mock_method_verify_called_within_async_does_not_raise_exception_when_method_called_from_task():
+    obj = mock(A)
+    every(obj.async_method).returns(2)
+
+    async def call():
+        await asyncio.sleep(0.01)
+        await obj.async_method(1)
+
+    async def wait():
+        task = asyncio.ensure_future(call())
+        await verify(obj.async_method).with_args(1).called_within_async(timeout=5)
+        await task
+
+    with not_raises(WrongNumberOfCallsException):
+        run(wait())
+
+
+def test_mock_method_verify_called_within_async_does_not_raise_exception_when_method_called_from_other_thread():
+    obj = mock(A)
+    every(obj.method).returns(2)
+    call_later(obj.method, 1)
+
+    with not_raises(WrongNumberOfCallsException):
+        run(verify(obj.method).called_within_async(timeout=5, times=1))
+
+
+def test_mock_method_verify_called_within_async_raises_exception_when_method_not_called_before_timeout():
+    obj = mock(A)
+    every(obj.method).returns(2)
+
+    with pytest.raises(WrongNumberOfCallsException):
+        run(verify(obj.method).called_within_async(timeout=0.05))
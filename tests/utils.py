@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import contextmanager
 
 import pytest
@@ -9,3 +10,11 @@ def not_raises(exception):
         yield
     except exception:
         raise pytest.fail(f"DID RAISE {exception}")
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()